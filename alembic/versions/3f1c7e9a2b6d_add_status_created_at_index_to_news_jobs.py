@@ -0,0 +1,40 @@
+"""add_status_created_at_index_to_news_jobs
+
+Revision ID: 3f1c7e9a2b6d
+Revises: 5d8b22e580b2
+Create Date: 2026-10-16 10:12:31.418207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c7e9a2b6d'
+down_revision = '5d8b22e580b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite index for stale-job sync and health queries (status first, then created_at).
+    # CONCURRENTLY cannot run inside a transaction block, so step out of Alembic's transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_news_jobs_status_created',
+            'news_jobs',
+            ['status', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_news_jobs_status_created',
+            table_name='news_jobs',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
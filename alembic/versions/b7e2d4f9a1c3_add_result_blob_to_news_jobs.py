@@ -0,0 +1,25 @@
+"""add_result_blob_to_news_jobs
+
+Revision ID: b7e2d4f9a1c3
+Revises: 3f1c7e9a2b6d
+Create Date: 2026-10-16 14:37:05.926114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d4f9a1c3'
+down_revision = '3f1c7e9a2b6d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # zstd-compressed workflow result, written by the persist_final_result activity
+    op.add_column('news_jobs', sa.Column('result_blob', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('news_jobs', 'result_blob')
@@ -4,6 +4,7 @@ import uuid
 from typing import List, Dict, Any
 from datetime import datetime
 from prometheus_client import Counter
+from temporalio import activity
 from dotenv import load_dotenv
 
 # Ensure environment variables are loaded
@@ -12,9 +13,9 @@ load_dotenv()
 from app.config.settings import get_settings
 from app.config.logging import get_logger, LogContext
 from app.config.database import SessionLocal
-from app.models.news import NewsAnalysis
-from app.services.redis_stream import RedisStreamService
-from app.services.groq_client import GroqClient
+from app.models.news import NewsAnalysis, NewsJob
+from app.services.redis_stream import redis_stream_service
+from app.services.groq_client import get_groq_client
 
 
 def ensure_json_serializable(obj):
@@ -43,15 +44,17 @@ class AnalystAgent:
     
     def __init__(self, job_id: str):
         self.job_id = job_id
-        self.redis_stream = RedisStreamService()
-        self.groq_client = GroqClient()
+        self.redis_stream = redis_stream_service
+        self.groq_client = get_groq_client()
         
-    async def run(self, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def run(self, summaries: List[Dict[str, Any]], include_overall_trends: bool = True) -> Dict[str, Any]:
         """
         Execute the analyst agent.
         
         Args:
             summaries: List of summary dictionaries
+            include_overall_trends: Whether to add the overall trends analysis
+                (disabled when summaries are analyzed in batches)
             
         Returns:
             Dict containing analyses
@@ -102,11 +105,15 @@ class AnalystAgent:
                 except Exception as e:
                     logger.error("Analysis task failed", error=str(e))
                     completed += 1
+                
+                # Report progress so Temporal can detect a stalled activity
+                if activity.in_activity():
+                    activity.heartbeat({"done": completed, "total": len(summaries)})
             
             total_processing_time = time.time() - start_time
             
             # Generate overall trend analysis
-            if analyses:
+            if include_overall_trends and analyses:
                 try:
                     overall_analysis = await self._generate_overall_trends_analysis(summaries, analyses)
                     analyses.append(overall_analysis)
@@ -137,6 +144,34 @@ class AnalystAgent:
                 "success_count": len(analyses)
             }
     
+    async def run_overall_trends(self, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Generate and save only the overall trends analysis across all summaries.
+        
+        Args:
+            summaries: List of summary dictionaries
+            
+        Returns:
+            Dict containing the overall trends analysis
+        """
+        with LogContext(job_id=self.job_id, agent="AnalystAgent"):
+            logger.info("Starting overall trends analysis", summaries_count=len(summaries))
+            
+            start_time = time.time()
+            overall_analysis = await self._generate_overall_trends_analysis(summaries, [])
+            total_processing_time = time.time() - start_time
+            overall_analysis["processing_time"] = total_processing_time
+            
+            await self._save_analyses([overall_analysis])
+            
+            logger.info("Overall trends analysis completed", total_time=total_processing_time)
+            
+            return {
+                "analyses": [overall_analysis],
+                "total_processing_time": total_processing_time,
+                "success_count": 1
+            }
+    
     async def _analyze_summary(self, summary: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze a single summary using NewsProcessingCore.
@@ -230,9 +265,6 @@ class AnalystAgent:
         Args:
             analyses: List of analysis dictionaries
         """
-        import uuid
-        from app.models.news import NewsJob
-        
         db = SessionLocal()
         try:
             # Get the actual job UUID from the job_id string
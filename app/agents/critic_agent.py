@@ -3,6 +3,7 @@ import asyncio
 from typing import List, Dict, Any
 from datetime import datetime
 from prometheus_client import Counter
+from temporalio import activity
 from dotenv import load_dotenv
 
 # Ensure environment variables are loaded
@@ -12,8 +13,8 @@ from app.config.settings import get_settings
 from app.config.logging import get_logger, LogContext
 from app.config.database import SessionLocal
 from app.models.news import NewsSummary
-from app.services.redis_stream import RedisStreamService
-from app.services.groq_client import GroqClient
+from app.services.redis_stream import redis_stream_service
+from app.services.groq_client import get_groq_client
 from app.agents.news_processing_core import NewsProcessingCore
 
 logger = get_logger(__name__)
@@ -28,8 +29,8 @@ class CriticAgent:
     
     def __init__(self, job_id: str):
         self.job_id = job_id
-        self.redis_stream = RedisStreamService()
-        self.groq_client = GroqClient()
+        self.redis_stream = redis_stream_service
+        self.groq_client = get_groq_client()
         
     async def run(self, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -89,6 +90,10 @@ class CriticAgent:
                 except Exception as e:
                     logger.error("Critique task failed", error=str(e))
                     completed += 1
+                
+                # Report progress so Temporal can detect a stalled activity
+                if activity.in_activity():
+                    activity.heartbeat({"done": completed, "total": len(summaries)})
             
             total_processing_time = time.time() - start_time
             
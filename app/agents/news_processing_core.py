@@ -6,12 +6,21 @@ orchestration patterns for news summarization, analysis, and critique.
 """
 
 import asyncio
+import re
 from typing import List, Dict, Any, Optional
 from app.config.logging import get_logger
 from app.services.groq_client import GroqClient
 
 logger = get_logger(__name__)
 
+# Section headers of the structured LLM responses, matched once per line
+_SUMMARY_SECTION_RE = re.compile(r"(SUMMARY|KEY POINTS):", re.IGNORECASE)
+_ANALYSIS_SECTION_RE = re.compile(r"(ANALYSIS|INSIGHTS|IMPACT):", re.IGNORECASE)
+_CRITIQUE_SECTION_RE = re.compile(
+    r"(QUALITY_SCORE|CRITIQUE|IMPROVEMENTS|IMPROVED_SUMMARY|IMPROVED_KEY_POINTS):", re.IGNORECASE
+)
+_BULLET_PREFIXES = ('•', '-', '*')
+
 
 class NewsProcessingCore:
     """
@@ -300,12 +309,15 @@ IMPACT: [collective impact assessment]
                 if not line:
                     continue
                 
-                if line.upper().startswith('SUMMARY:'):
-                    summary = line[8:].strip()
+                match = _SUMMARY_SECTION_RE.match(line)
+                header = match.group(1).upper() if match else None
+                
+                if header == 'SUMMARY':
+                    summary = line[match.end():].strip()
                     current_section = "summary"
-                elif line.upper().startswith('KEY POINTS:'):
+                elif header == 'KEY POINTS':
                     current_section = "points"
-                elif line.startswith('•') or line.startswith('-') or line.startswith('*'):
+                elif line.startswith(_BULLET_PREFIXES):
                     bullet_points.append(line[1:].strip())
                 elif current_section == "summary" and not summary:
                     summary = line
@@ -346,15 +358,18 @@ IMPACT: [collective impact assessment]
                 if not line:
                     continue
                 
-                if line.upper().startswith('ANALYSIS:'):
-                    analysis = line[9:].strip()
+                match = _ANALYSIS_SECTION_RE.match(line)
+                header = match.group(1).upper() if match else None
+                
+                if header == 'ANALYSIS':
+                    analysis = line[match.end():].strip()
                     current_section = "analysis"
-                elif line.upper().startswith('INSIGHTS:'):
+                elif header == 'INSIGHTS':
                     current_section = "insights"
-                elif line.upper().startswith('IMPACT:'):
-                    impact_assessment = line[7:].strip()
+                elif header == 'IMPACT':
+                    impact_assessment = line[match.end():].strip()
                     current_section = "impact"
-                elif line.startswith('•') or line.startswith('-') or line.startswith('*'):
+                elif line.startswith(_BULLET_PREFIXES):
                     if current_section == "insights":
                         insights.append(line[1:].strip())
                 elif current_section == "analysis" and not analysis:
@@ -402,30 +417,33 @@ IMPACT: [collective impact assessment]
                 if not line:
                     continue
                 
-                if line.upper().startswith('QUALITY_SCORE:'):
+                match = _CRITIQUE_SECTION_RE.match(line)
+                header = match.group(1).upper() if match else None
+                
+                if header == 'QUALITY_SCORE':
                     try:
-                        score_text = line.split(':', 1)[1].strip()
+                        score_text = line[match.end():].strip()
                         quality_score = int(score_text.split()[0])  # Extract just the number
                         quality_score = max(1, min(10, quality_score))  # Clamp to 1-10
                     except:
                         quality_score = 7  # Default if parsing fails
                         
-                elif line.upper().startswith('CRITIQUE:'):
-                    critique = line.split(':', 1)[1].strip()
+                elif header == 'CRITIQUE':
+                    critique = line[match.end():].strip()
                     current_section = "critique"
                     
-                elif line.upper().startswith('IMPROVEMENTS:'):
+                elif header == 'IMPROVEMENTS':
                     current_section = "improvements"
                     
-                elif line.upper().startswith('IMPROVED_SUMMARY:'):
-                    improved_summary = line.split(':', 1)[1].strip()
+                elif header == 'IMPROVED_SUMMARY':
+                    improved_summary = line[match.end():].strip()
                     current_section = "summary"
                     
-                elif line.upper().startswith('IMPROVED_KEY_POINTS:'):
+                elif header == 'IMPROVED_KEY_POINTS':
                     current_section = "points"
                     improved_points = []
                     
-                elif line.startswith('•') or line.startswith('-') or line.startswith('*'):
+                elif line.startswith(_BULLET_PREFIXES):
                     if current_section == "points":
                         improved_points.append(line[1:].strip())
                     elif current_section == "improvements":
@@ -4,6 +4,8 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import asyncio
+import re
+import uuid
 from urllib.parse import urljoin, urlparse
 from prometheus_client import Counter
 import urllib3
@@ -11,8 +13,9 @@ import urllib3
 from app.config.settings import get_settings
 from app.config.logging import get_logger, LogContext
 from app.config.database import SessionLocal
-from app.models.news import NewsArticle
-from app.services.redis_stream import RedisStreamService
+from app.models.news import NewsArticle, NewsJob
+from app.services.redis_stream import redis_stream_service
+from app.services.result_cache import result_cache
 
 # Disable SSL warnings for problematic feeds
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -23,47 +26,88 @@ settings = get_settings()
 # Prometheus Metrics
 ARTICLES_SCRAPED = Counter('news_articles_scraped_total', 'Total articles scraped', ['source'])
 
+# Maximum number of unique articles kept per scraping job
+MAX_ARTICLES_PER_JOB = 10
+
+# Maximum number of RSS feeds fetched at the same time
+MAX_CONCURRENT_FEEDS = 5
+
 
 class ScraperAgent:
     """Agent responsible for scraping news articles from RSS feeds."""
     
     def __init__(self, job_id: str):
         self.job_id = job_id
-        self.redis_stream = RedisStreamService()
+        self.redis_stream = redis_stream_service
         self.rss_feeds = settings.rss_feeds.split(",")
         
-    async def run(self, target_date: str = None) -> Dict[str, Any]:
+    async def run(
+        self,
+        target_date: str = None,
+        feed_urls: Optional[List[str]] = None,
+        max_articles: int = MAX_ARTICLES_PER_JOB
+    ) -> Dict[str, Any]:
         """
         Execute the scraper agent.
         
         Args:
             target_date: Deprecated - scraper now fetches latest news regardless of date
+            feed_urls: Feeds to scrape; defaults to all configured RSS feeds
+            max_articles: Maximum number of unique articles to keep
         
         Returns:
             Dict containing scraped articles
         """
         with LogContext(job_id=self.job_id, agent="ScraperAgent"):
             logger.info("Starting latest news scraping")
-            
-            # Send status update
-            await self.redis_stream.publish_update(
-                job_id=self.job_id,
-                status="scraping_started",
-                message="Starting latest news article scraping"
-            )
-            
-            all_articles = []
-            
-            for feed_url in self.rss_feeds:
-                feed_url = feed_url.strip()
-                try:
-                    logger.info("Scraping feed for latest news", feed_url=feed_url)
-                    articles = await self._scrape_feed(feed_url)
-                    all_articles.extend(articles)
-                    
-                except Exception as e:
-                    logger.error("Failed to scrape feed", feed_url=feed_url, error=str(e))
-                    continue
+            await self.publish_scraping_started()
+        
+        all_articles = await self.scrape(target_date, feed_urls)
+        return await self.select_articles(all_articles, max_articles)
+    
+    async def publish_scraping_started(self):
+        """Send the scraping_started status update for the job."""
+        await self.redis_stream.publish_update(
+            job_id=self.job_id,
+            status="scraping_started",
+            message="Starting latest news article scraping"
+        )
+    
+    async def scrape(self, target_date: str = None, feed_urls: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape raw articles from RSS feeds without deduplicating or saving them.
+        
+        Args:
+            target_date: Deprecated - scraper now fetches latest news regardless of date
+            feed_urls: Feeds to scrape; defaults to all configured RSS feeds
+        
+        Returns:
+            List of article dictionaries in feed order
+        """
+        with LogContext(job_id=self.job_id, agent="ScraperAgent"):
+            feeds = [feed_url.strip() for feed_url in (self.rss_feeds if feed_urls is None else feed_urls)]
+            return await self._scrape_feeds(target_date, feeds)
+    
+    async def select_articles(
+        self,
+        all_articles: List[Dict[str, Any]],
+        max_articles: int = MAX_ARTICLES_PER_JOB
+    ) -> Dict[str, Any]:
+        """
+        Deduplicate scraped articles, keep the first max_articles and save them under the job.
+        
+        Args:
+            all_articles: Raw articles returned by scrape(), possibly from several calls
+            max_articles: Maximum number of unique articles to keep
+        
+        Returns:
+            Dict containing the saved articles
+        """
+        with LogContext(job_id=self.job_id, agent="ScraperAgent"):
+            # Dates come back as ISO strings when articles went through Redis
+            for article in all_articles:
+                if isinstance(article.get("published_at"), str):
+                    article["published_at"] = datetime.fromisoformat(article["published_at"])
             
             # Remove duplicates
             unique_articles = await self._remove_duplicates(all_articles)
@@ -71,8 +115,7 @@ class ScraperAgent:
                        original_count=len(all_articles), 
                        unique_count=len(unique_articles))
             
-            # Increase limit to top 10 unique articles (was 5)
-            top_articles = unique_articles[:10]
+            top_articles = unique_articles[:max_articles]
             
             # Save articles to database
             await self._save_articles(top_articles)
@@ -93,6 +136,61 @@ class ScraperAgent:
                 "selected_count": len(top_articles)
             }
     
+    async def _scrape_feeds(self, target_date: Optional[str], feeds: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape raw articles from the feeds, reusing a recent scrape of the same feeds.
+        
+        Only the raw feed entries are cached; deduplication and saving always
+        run for the current job.
+        
+        Args:
+            target_date: Date the scrape is for (part of the cache key)
+            feeds: RSS feed URLs
+            
+        Returns:
+            List of article dictionaries in feed order
+        """
+        cache_key = result_cache.scrape_key(target_date, feeds)
+        cached = await result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached scrape result", cache_key=cache_key, articles_count=len(cached))
+            return cached
+        
+        # Scrape feeds concurrently; gather keeps feed order so selection stays stable
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEEDS)
+        results = await asyncio.gather(
+            *[self._scrape_feed_with_semaphore(semaphore, feed_url) for feed_url in feeds],
+            return_exceptions=True
+        )
+        
+        all_articles = []
+        for feed_url, result in zip(feeds, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to scrape feed", feed_url=feed_url, error=str(result))
+                continue
+            all_articles.extend(result)
+        
+        # Empty results are not cached so a feed outage doesn't stick for the whole TTL
+        if all_articles:
+            await result_cache.set(cache_key, all_articles, settings.scrape_cache_ttl_seconds)
+        
+        return all_articles
+    
+    async def _scrape_feed_with_semaphore(self, semaphore: asyncio.Semaphore, feed_url: str) -> List[Dict[str, Any]]:
+        """
+        Scrape a single RSS feed with concurrency control.
+        
+        Args:
+            semaphore: Concurrency control
+            feed_url: RSS feed URL
+            
+        Returns:
+            List of article dictionaries
+        """
+        async with semaphore:
+            logger.info("Scraping feed for latest news", feed_url=feed_url)
+            return await self._scrape_feed(feed_url)
+    
     async def _scrape_feed(self, feed_url: str) -> List[Dict[str, Any]]:
         """
         Scrape latest articles from a single RSS feed.
@@ -123,7 +221,8 @@ class ScraperAgent:
             for i, method in enumerate(parsing_methods, 1):
                 try:
                     logger.info(f"Trying parsing method {i}", feed_url=feed_url)
-                    feed = method()
+                    # Parsing does blocking network I/O, keep it off the event loop
+                    feed = await asyncio.to_thread(method)
                     if feed and hasattr(feed, 'entries') and feed.entries:
                         logger.info(f"Parsing method {i} successful", feed_url=feed_url, entries_count=len(feed.entries))
                         break
@@ -218,7 +317,6 @@ class ScraperAgent:
         
         # Clean up HTML tags from summary if present
         if summary:
-            from bs4 import BeautifulSoup
             summary = BeautifulSoup(summary, 'html.parser').get_text(strip=True)
         
         # For tech news, ensure we have some content to work with
@@ -303,7 +401,7 @@ class ScraperAgent:
                 'User-Agent': 'Mozilla/5.0 (compatible; NewsBot/1.0)'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = await asyncio.to_thread(requests.get, url, headers=headers, timeout=10)
             response.raise_for_status()
             
             # Parse HTML
@@ -363,7 +461,7 @@ class ScraperAgent:
                 'User-Agent': 'Mozilla/5.0 (compatible; NewsBot/1.0)'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = await asyncio.to_thread(requests.get, url, headers=headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -451,8 +549,6 @@ class ScraperAgent:
         Returns:
             Parsed datetime or None if not found
         """
-        import re
-        
         try:
             # Common URL date patterns
             patterns = [
@@ -577,7 +673,6 @@ class ScraperAgent:
     
     def _normalize_title(self, title: str) -> str:
         """Normalize title for duplicate detection."""
-        import re
         # Remove special characters, extra spaces, and convert to lowercase
         normalized = re.sub(r'[^\w\s]', '', title.lower())
         normalized = ' '.join(normalized.split())  # Remove extra whitespace
@@ -645,9 +740,6 @@ class ScraperAgent:
         Args:
             articles: List of article dictionaries (modified in-place with IDs)
         """
-        import uuid
-        from app.models.news import NewsJob
-        
         db = SessionLocal()
         try:
             # Get the actual job UUID from the job_id string
@@ -3,6 +3,7 @@ import asyncio
 from typing import List, Dict, Any
 from datetime import datetime
 from prometheus_client import Counter
+from temporalio import activity
 from dotenv import load_dotenv
 
 # Ensure environment variables are loaded
@@ -11,9 +12,9 @@ load_dotenv()
 from app.config.settings import get_settings
 from app.config.logging import get_logger, LogContext
 from app.config.database import SessionLocal
-from app.models.news import NewsSummary
-from app.services.redis_stream import RedisStreamService
-from app.services.groq_client import GroqClient
+from app.models.news import NewsJob, NewsSummary
+from app.services.redis_stream import redis_stream_service
+from app.services.groq_client import get_groq_client
 from app.agents.news_processing_core import NewsProcessingCore
 
 logger = get_logger(__name__)
@@ -28,8 +29,8 @@ class SummarizerAgent:
     
     def __init__(self, job_id: str):
         self.job_id = job_id
-        self.redis_stream = RedisStreamService()
-        self.groq_client = GroqClient()
+        self.redis_stream = redis_stream_service
+        self.groq_client = get_groq_client()
         
     async def run(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -87,6 +88,10 @@ class SummarizerAgent:
                 except Exception as e:
                     logger.error("Task failed", error=str(e))
                     completed += 1
+                
+                # Report progress so Temporal can detect a stalled activity
+                if activity.in_activity():
+                    activity.heartbeat({"done": completed, "total": len(articles)})
             
             total_processing_time = time.time() - start_time
             
@@ -211,9 +216,6 @@ class SummarizerAgent:
         Args:
             summaries: List of summary dictionaries
         """
-        import uuid
-        from app.models.news import NewsJob
-        
         db = SessionLocal()
         try:
             # Get the actual job UUID from the job_id string
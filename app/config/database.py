@@ -11,6 +11,8 @@ settings = get_settings()
 # Database Engine
 engine = create_engine(
     settings.database_url,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
     pool_pre_ping=True,
     pool_recycle=300,
     echo=settings.debug
@@ -6,7 +6,7 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.exporter.jaeger.thrift import JaegerExporter
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.exporter.prometheus import PrometheusMetricReader
 from prometheus_client import start_http_server
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -16,8 +16,10 @@ from opentelemetry.instrumentation.requests import RequestsInstrumentor
 from opentelemetry.sdk.resources import Resource
 
 from app.config.logging import get_logger
+from app.config.settings import get_settings
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 def setup_telemetry(app_name: str = "ai-news-summarizer"):
@@ -35,12 +37,18 @@ def setup_telemetry(app_name: str = "ai-news-summarizer"):
         "deployment.environment": os.getenv("ENVIRONMENT", "development")
     })
     
-    # Set up tracing
-    setup_tracing(resource)
-    
     # Set up metrics
     setup_metrics(resource)
     
+    # Tracing off: leave the default no-op provider in place and skip the
+    # instrumentors, so no span work runs on the request path
+    if not settings.tracing_enabled:
+        logger.info("Distributed tracing disabled, skipping tracer and instrumentation setup")
+        return
+    
+    # Set up tracing
+    setup_tracing(resource)
+    
     # Instrument libraries
     instrument_libraries()
     
@@ -48,24 +56,29 @@ def setup_telemetry(app_name: str = "ai-news-summarizer"):
 
 
 def setup_tracing(resource: Resource):
-    """Configure tracing with Jaeger exporter."""
+    """Configure tracing with an OTLP/gRPC exporter (viewed in Jaeger)."""
     
     # Configure tracer provider
     tracer_provider = TracerProvider(resource=resource)
     trace.set_tracer_provider(tracer_provider)
     
-    # Configure Jaeger exporter
-    jaeger_exporter = JaegerExporter(
-        agent_host_name=os.getenv("JAEGER_HOST", "localhost"),
-        agent_port=int(os.getenv("JAEGER_AGENT_PORT", "6831")),
-        collector_endpoint=f"http://{os.getenv('JAEGER_HOST', 'localhost')}:14268/api/traces",
+    # Configure OTLP exporter - Jaeger accepts OTLP natively, so the UI is unchanged
+    otlp_exporter = OTLPSpanExporter(
+        endpoint=settings.otlp_endpoint,
+        insecure=True,
     )
     
-    # Add batch span processor
-    span_processor = BatchSpanProcessor(jaeger_exporter)
+    # Add batch span processor (tuned for bursty workflow activity)
+    span_processor = BatchSpanProcessor(
+        otlp_exporter,
+        max_queue_size=settings.otel_bsp_max_queue_size,
+        schedule_delay_millis=settings.otel_bsp_schedule_delay_millis,
+        max_export_batch_size=settings.otel_bsp_max_export_batch_size,
+        export_timeout_millis=settings.otel_bsp_export_timeout_millis,
+    )
     tracer_provider.add_span_processor(span_processor)
     
-    logger.info("Tracing configured with Jaeger exporter")
+    logger.info("Tracing configured with OTLP exporter", endpoint=settings.otlp_endpoint)
 
 
 def setup_metrics(resource: Resource):
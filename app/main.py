@@ -2,7 +2,7 @@ from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import cast, String, or_, and_
+from sqlalchemy import cast, String, or_, and_, func
 from datetime import datetime, timedelta
 import asyncio
 import json
@@ -21,6 +21,7 @@ from app.models.news import (
     NewsJobResponse, NewsArticleResponse, NewsSummaryResponse, NewsAnalysisResponse,
     NewsStreamUpdate, NewsJobResult
 )
+from app.services.groq_client import close_groq_client
 from app.services.redis_stream import redis_stream_service
 from app.services.scheduler import (
     trigger_manual_news_processing,
@@ -32,7 +33,9 @@ from app.services.temporal_client import temporal_client
 from app.services.workflow_status_sync import (
     sync_stale_jobs,
     get_workflow_health,
-    terminate_job
+    terminate_job,
+    terminate_jobs,
+    close_status_sync
 )
 
 
@@ -44,13 +47,16 @@ class ScheduleRequest(BaseModel):
     custom_cron: str = "0 */1 * * *"
 
 
+class TerminateJobsRequest(BaseModel):
+    """Request model for bulk job termination."""
+    job_ids: List[str]
+    reason: str = "Manual termination"
+
+
 # Prometheus Metrics
 REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint'])
 REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration')
 ACTIVE_JOBS = Gauge('news_jobs_active_total', 'Number of active news jobs')
-ARTICLES_SCRAPED = Counter('news_articles_scraped_total', 'Total articles scraped', ['source'])
-SUMMARIES_GENERATED = Counter('news_summaries_generated_total', 'Total summaries generated')
-WORKFLOW_ERRORS = Counter('news_workflow_errors_total', 'Total workflow errors', ['error_type'])
 
 # Initialize logging
 setup_logging()
@@ -85,7 +91,8 @@ app.add_middleware(
 )
 
 # Instrument FastAPI with OpenTelemetry
-FastAPIInstrumentor.instrument_app(app)
+if settings.tracing_enabled:
+    FastAPIInstrumentor.instrument_app(app)
 
 # Get tracer for this module
 tracer = get_tracer(__name__)
@@ -118,10 +125,18 @@ async def shutdown_event():
         await temporal_client.close()
         logger.info("Temporal client closed")
         
+        # Publish queued job status updates before Redis goes away
+        await close_status_sync()
+        logger.info("Status updates flushed")
+        
         # Close Redis connections if needed
         await redis_stream_service.close()
         logger.info("Redis connections closed")
         
+        # Close pooled Groq connections
+        await close_groq_client()
+        logger.info("Groq client closed")
+        
         logger.info("AI News Summarizer service shutdown complete")
 
 
@@ -167,9 +182,10 @@ async def trigger_news_workflow(
     job_id = str(uuid.uuid4())
     
     with tracer.start_as_current_span("trigger_news_workflow") as span:
-        span.set_attribute("job_id", job_id)
-        span.set_attribute("endpoint", "trigger_news_workflow") 
-        span.set_attribute("target_date", str(parsed_date))
+        if span.is_recording():
+            span.set_attribute("job_id", job_id)
+            span.set_attribute("endpoint", "trigger_news_workflow")
+            span.set_attribute("target_date", str(parsed_date))
         
         with LogContext(job_id=job_id, endpoint="trigger_news_workflow", target_date=str(parsed_date)):
             logger.info("Triggering manual news summarization workflow", target_date=str(parsed_date))
@@ -378,10 +394,13 @@ async def get_job_result(job_id: str, db: Session = Depends(get_db)):
         if job.completed_at and job.created_at:
             processing_time = (job.completed_at - job.created_at).total_seconds()
         
+        # Count in the database instead of loading every article row
+        articles_count = db.query(func.count(NewsArticle.id)).filter(NewsArticle.job_id == job.id).scalar()
+        
         result = NewsJobResult(
             job_id=job.job_id,
             status=job.status,
-            articles_count=len(job.articles),
+            articles_count=articles_count,
             summaries=[s for s in job.summaries],
             analyses=[a for a in job.analyses],
             processing_time=processing_time,
@@ -816,8 +835,8 @@ async def _generate_timeline_summary(news_items: List[Dict], date_filter: str =
                 all_insights.extend(item["insights"])
         
         # Create a brief summary using the Groq client
-        from app.services.groq_client import GroqClient
-        groq_client = GroqClient()
+        from app.services.groq_client import get_groq_client
+        groq_client = get_groq_client()
         
         date_context = f" on {date_filter}" if date_filter else " today"
         
@@ -1376,6 +1395,31 @@ async def terminate_workflow(job_id: str, reason: str = "Manual termination"):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/news/workflow/terminate")
+async def terminate_workflows(request: TerminateJobsRequest):
+    """
+    Terminate several running workflows at once.
+    
+    Args:
+        request: Job IDs to terminate and the reason
+        
+    Returns:
+        dict: Termination result
+    """
+    try:
+        terminated = await terminate_jobs(request.job_ids, request.reason)
+        
+        return {
+            "success": len(terminated) == len(set(request.job_ids)),
+            "terminated_job_ids": terminated,
+            "message": f"Terminated {len(terminated)}/{len(set(request.job_ids))} jobs: {request.reason}"
+        }
+        
+    except Exception as e:
+        logger.error(f"Error terminating workflows {request.job_ids}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -1,9 +1,9 @@
 from datetime import datetime, date
 from typing import List, Optional
 import uuid
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Float, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Float, ForeignKey, Date, Index, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.dialects.postgresql import UUID
 from pydantic import BaseModel
 
@@ -22,11 +22,17 @@ class NewsJob(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
     error_message = Column(Text, nullable=True)
+    result_blob = deferred(Column(LargeBinary, nullable=True))  # zstd-compressed orjson workflow result, loaded on access only
     
     # Relationships
     articles = relationship("NewsArticle", back_populates="job", cascade="all, delete-orphan")
     summaries = relationship("NewsSummary", back_populates="job", cascade="all, delete-orphan")
     analysis = relationship("NewsAnalysis", back_populates="job", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Covers stale-job sync (status + created_at < cutoff) and health queries
+        Index("ix_news_jobs_status_created", "status", "created_at"),
+    )
 
 
 class NewsArticle(Base):
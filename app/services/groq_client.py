@@ -1,7 +1,9 @@
 import httpx
 from typing import Dict, Any, Optional, List
+import hashlib
 import json
 import os
+import time
 
 from app.config.settings import get_settings
 from app.config.logging import get_logger, LogContext
@@ -9,6 +11,21 @@ from app.config.logging import get_logger, LogContext
 logger = get_logger(__name__)
 settings = get_settings()
 
+# How long a passed health check is trusted before probing Groq again
+HEALTH_CHECK_TTL_SECONDS = 30
+
+# Idle keep-alive connections kept open to Groq by the shared HTTP client
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Seconds an idle pooled connection stays open, long enough to span the gap between workflow batches
+KEEPALIVE_EXPIRY_SECONDS = 60
+
+# Health checks give up quickly when Groq can't be reached instead of waiting out the full timeout
+HEALTH_CHECK_TIMEOUT = httpx.Timeout(10, connect=2)
+
+# (base URL, API key hash) -> monotonic time until which the last passed check is valid
+_health_cache: Dict[str, float] = {}
+
 
 class GroqClient:
     """Client for interacting with Groq API for fast LLM inference."""
@@ -21,6 +38,25 @@ class GroqClient:
         self.base_url = "https://api.groq.com/openai/v1"
         self.default_model = "llama-3.1-8b-instant"  # Fast Llama3 model
         self.timeout = 30  # Groq is much faster than local Ollama
+        self.http_client: Optional[httpx.AsyncClient] = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if not self.http_client:
+            self.http_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+                )
+            )
+        return self.http_client
+    
+    async def close(self):
+        """Close the pooled HTTP client."""
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
         
     async def generate(
         self, 
@@ -94,25 +130,25 @@ class GroqClient:
             }
             
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.base_url}/chat/completions",
-                        json=payload,
-                        headers=headers
-                    )
-                    response.raise_for_status()
-                    
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    
-                    # Log usage statistics
-                    usage = result.get("usage", {})
-                    logger.debug("Groq chat completed successfully", 
-                               response_length=len(content),
-                               prompt_tokens=usage.get("prompt_tokens"),
-                               completion_tokens=usage.get("completion_tokens"))
-                    
-                    return content
+                client = self._get_http_client()
+                response = await client.post(
+                    f"{self.base_url}/chat/completions",
+                    json=payload,
+                    headers=headers
+                )
+                response.raise_for_status()
+                
+                result = response.json()
+                content = result["choices"][0]["message"]["content"]
+                
+                # Log usage statistics
+                usage = result.get("usage", {})
+                logger.debug("Groq chat completed successfully", 
+                           response_length=len(content),
+                           prompt_tokens=usage.get("prompt_tokens"),
+                           completion_tokens=usage.get("completion_tokens"))
+                
+                return content
                     
             except httpx.TimeoutException:
                 logger.error("Groq request timed out")
@@ -136,9 +172,17 @@ class GroqClient:
         """
         Check if Groq service is healthy.
         
+        A passed check is reused for HEALTH_CHECK_TTL_SECONDS; failures are
+        never cached, so a broken key or outage is reported on the next call.
+        An unreachable endpoint fails after the short connect timeout.
+        
         Returns:
             True if healthy, False otherwise
         """
+        cache_key = f"{self.base_url}:{hashlib.sha256(self.api_key.encode()).hexdigest()}"
+        if _health_cache.get(cache_key, 0.0) > time.monotonic():
+            return True
+        
         try:
             # Simple test with available models endpoint first
             headers = {
@@ -146,34 +190,39 @@ class GroqClient:
                 "Content-Type": "application/json"
             }
             
-            async with httpx.AsyncClient(timeout=10) as client:
-                # Try to list models as a health check
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                # If that works, try a simple chat completion
-                test_payload = {
-                    "model": self.default_model,
-                    "messages": [{"role": "user", "content": "Hi"}],
-                    "max_tokens": 5,
-                    "temperature": 0.0
-                }
-                
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json=test_payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                logger.info("Groq health check passed")
-                return True
+            client = self._get_http_client()
+            
+            # Try to list models as a health check
+            response = await client.get(
+                f"{self.base_url}/models",
+                headers=headers,
+                timeout=HEALTH_CHECK_TIMEOUT
+            )
+            response.raise_for_status()
+            
+            # If that works, try a simple chat completion
+            test_payload = {
+                "model": self.default_model,
+                "messages": [{"role": "user", "content": "Hi"}],
+                "max_tokens": 5,
+                "temperature": 0.0
+            }
+            
+            response = await client.post(
+                f"{self.base_url}/chat/completions",
+                json=test_payload,
+                headers=headers,
+                timeout=HEALTH_CHECK_TIMEOUT
+            )
+            response.raise_for_status()
+            
+            logger.info("Groq health check passed")
+            _health_cache[cache_key] = time.monotonic() + HEALTH_CHECK_TTL_SECONDS
+            return True
                 
         except Exception as e:
             logger.error("Groq health check failed", error=str(e))
+            _health_cache.pop(cache_key, None)
             return False
     
     async def list_models(self) -> List[str]:
@@ -189,18 +238,19 @@ class GroqClient:
                 "Content-Type": "application/json"
             }
             
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                models = [model["id"] for model in result.get("data", [])]
-                
-                logger.debug("Listed Groq models", count=len(models))
-                return models
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.base_url}/models",
+                headers=headers,
+                timeout=10
+            )
+            response.raise_for_status()
+            
+            result = response.json()
+            models = [model["id"] for model in result.get("data", [])]
+            
+            logger.debug("Listed Groq models", count=len(models))
+            return models
                 
         except Exception as e:
             logger.error("Failed to list Groq models", error=str(e))
@@ -216,4 +266,22 @@ class GroqClient:
     
     def get_smart_model(self) -> str:
         """Get a smart model for analysis and critique tasks."""
-        return "llama-3.3-70b-versatile"  # Higher reasoning capabilities
\ No newline at end of file
+        return "llama-3.3-70b-versatile"  # Higher reasoning capabilities
+
+
+# Shared client instance, created on first use so imports don't require GROQ_API_KEY
+_groq_client: Optional[GroqClient] = None
+
+
+def get_groq_client() -> GroqClient:
+    """Get the shared Groq client, creating it on first use."""
+    global _groq_client
+    if _groq_client is None:
+        _groq_client = GroqClient()
+    return _groq_client
+
+
+async def close_groq_client():
+    """Close the shared Groq client's HTTP connections, if it was created."""
+    if _groq_client is not None:
+        await _groq_client.close()
@@ -0,0 +1,26 @@
+"""
+Compressed storage of final workflow results on the news_jobs row.
+"""
+
+from typing import Any, Dict, Optional
+import orjson
+import zstandard
+from sqlalchemy.orm import Session
+
+from app.models.news import NewsJob
+
+
+def encode_result(result: Dict[str, Any]) -> bytes:
+    """Serialize and zstd-compress a workflow result for NewsJob.result_blob."""
+    return zstandard.ZstdCompressor().compress(orjson.dumps(result))
+
+
+def decode_result(blob: bytes) -> Dict[str, Any]:
+    """Decompress and parse a blob written by encode_result."""
+    return orjson.loads(zstandard.ZstdDecompressor().decompress(blob))
+
+
+def load_final_result(db: Session, job_id: str) -> Optional[Dict[str, Any]]:
+    """Load the stored workflow result of a job, or None if there is none."""
+    blob = db.query(NewsJob.result_blob).filter(NewsJob.job_id == job_id).scalar()
+    return decode_result(blob) if blob else None
@@ -73,6 +73,13 @@ LLM_RESPONSE_TIME = Histogram(
     registry=REGISTRY
 )
 
+WORKFLOW_ERRORS = Counter(
+    'news_workflow_errors_total',
+    'Total workflow errors',
+    ['error_type'],
+    registry=REGISTRY
+)
+
 
 class MetricsCollector:
     """Collector for application-specific metrics."""
@@ -0,0 +1,82 @@
+from typing import Any, Dict, List, Optional
+import orjson
+import redis.asyncio as redis
+
+from app.config.settings import get_settings
+from app.config.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class PayloadStore:
+    """
+    Redis store for the articles and summaries handed between workflow activities.
+
+    Items are kept in one hash per job and kind (``{job_id}:{kind}``) keyed by
+    their database ID, so activities only pass the IDs through Temporal.
+    """
+
+    def __init__(self):
+        self.redis_client: Optional[redis.Redis] = None
+
+    async def _get_redis_client(self) -> redis.Redis:
+        """Get or create Redis client."""
+        if not self.redis_client:
+            self.redis_client = redis.from_url(settings.redis_url)
+        return self.redis_client
+
+    async def store_items(self, job_id: str, kind: str, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store items under the job and return their IDs.
+
+        Args:
+            job_id: Job the items belong to
+            kind: Item kind, e.g. "articles" or "summaries"
+            items: Items with an "id" key
+
+        Returns:
+            Item IDs in the original order
+        """
+        item_ids = [str(item["id"]) for item in items]
+        if not items:
+            return item_ids
+
+        key = f"{job_id}:{kind}"
+        client = await self._get_redis_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping={item_id: orjson.dumps(item) for item_id, item in zip(item_ids, items)})
+            pipe.expire(key, settings.job_payload_ttl_seconds)
+            await pipe.execute()
+
+        return item_ids
+
+    async def load_items(self, job_id: str, kind: str, item_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Load stored items by ID.
+
+        Args:
+            job_id: Job the items belong to
+            kind: Item kind, e.g. "articles" or "summaries"
+            item_ids: IDs returned by store_items
+
+        Returns:
+            Items in the order of item_ids
+        """
+        if not item_ids:
+            return []
+
+        key = f"{job_id}:{kind}"
+        client = await self._get_redis_client()
+        values = await client.hmget(key, item_ids)
+
+        missing = [item_id for item_id, value in zip(item_ids, values) if value is None]
+        if missing:
+            logger.error("Stored items not found", key=key, missing_count=len(missing))
+            raise KeyError(f"{len(missing)} {kind} not found in {key}")
+
+        return [orjson.loads(value) for value in values]
+
+
+# Global payload store instance
+payload_store = PayloadStore()
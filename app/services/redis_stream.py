@@ -1,7 +1,7 @@
 import json
 import asyncio
 from datetime import datetime
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 import redis.asyncio as redis
 
 from app.config.settings import get_settings
@@ -45,28 +45,13 @@ class RedisStreamService:
             try:
                 client = await self._get_redis_client()
                 
-                update = NewsStreamUpdate(
-                    job_id=job_id,
-                    status=status,
-                    message=message,
-                    timestamp=datetime.utcnow(),
-                    data=data
-                )
+                channel, payload, stream_key, stream_data = self._build_update(job_id, status, message, data)
                 
                 # Publish to job-specific channel
-                channel = f"news:{job_id}"
-                await client.publish(channel, update.json())
+                await client.publish(channel, payload)
                 
                 # Also add to stream for persistence
-                stream_data = {
-                    "job_id": job_id,
-                    "status": status,
-                    "message": message,
-                    "timestamp": update.timestamp.isoformat(),
-                    "data": json.dumps(data) if data else ""
-                }
-                
-                await client.xadd(f"{self.stream_key}:{job_id}", stream_data)
+                await client.xadd(stream_key, stream_data)
                 
                 logger.debug("Published update", message=message)
                 
@@ -74,6 +59,61 @@ class RedisStreamService:
                 logger.error("Failed to publish update", error=str(e))
                 # Don't raise - we don't want to break the main workflow for streaming issues
     
+    async def publish_updates(self, updates: List[Dict[str, Any]]):
+        """
+        Publish several status updates in one pipelined round trip.
+        
+        Args:
+            updates: List of dicts with job_id, status, message and optional data
+        """
+        if not updates:
+            return
+        
+        try:
+            client = await self._get_redis_client()
+            
+            async with client.pipeline(transaction=False) as pipe:
+                for update in updates:
+                    channel, payload, stream_key, stream_data = self._build_update(
+                        update["job_id"], update["status"], update["message"], update.get("data")
+                    )
+                    pipe.publish(channel, payload)
+                    pipe.xadd(stream_key, stream_data)
+                
+                await pipe.execute()
+            
+            logger.debug("Published updates", count=len(updates))
+            
+        except Exception as e:
+            logger.error("Failed to publish updates", count=len(updates), error=str(e))
+            # Don't raise - we don't want to break the main workflow for streaming issues
+    
+    def _build_update(
+        self,
+        job_id: str,
+        status: str,
+        message: str,
+        data: Optional[dict] = None
+    ) -> Tuple[str, str, str, Dict[str, str]]:
+        """Build the pub/sub channel, payload, stream key and stream entry for an update."""
+        update = NewsStreamUpdate(
+            job_id=job_id,
+            status=status,
+            message=message,
+            timestamp=datetime.utcnow(),
+            data=data
+        )
+        
+        stream_data = {
+            "job_id": job_id,
+            "status": status,
+            "message": message,
+            "timestamp": update.timestamp.isoformat(),
+            "data": json.dumps(data) if data else ""
+        }
+        
+        return f"news:{job_id}", update.json(), f"{self.stream_key}:{job_id}", stream_data
+    
     async def subscribe_to_updates(self, job_id: str) -> AsyncGenerator[NewsStreamUpdate, None]:
         """
         Subscribe to real-time updates for a specific job.
@@ -0,0 +1,61 @@
+import hashlib
+from typing import Any, List, Optional
+import orjson
+import redis.asyncio as redis
+
+from app.config.settings import get_settings
+from app.config.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class ResultCache:
+    """Redis-backed cache for JSON-serializable activity results."""
+
+    def __init__(self):
+        self.redis_client: Optional[redis.Redis] = None
+
+    async def _get_redis_client(self) -> redis.Redis:
+        """Get or create Redis client."""
+        if not self.redis_client:
+            self.redis_client = redis.from_url(settings.redis_url)
+        return self.redis_client
+
+    @staticmethod
+    def scrape_key(target_date: Optional[str], feed_urls: List[str]) -> str:
+        """Build the cache key for a scrape of the given feeds."""
+        feed_hash = hashlib.sha1(",".join(sorted(feed_urls)).encode()).hexdigest()
+        return f"scrape:{target_date or 'latest'}:{feed_hash}"
+
+    @staticmethod
+    def activity_key(activity_type: str, job_id: str, inputs: Any) -> str:
+        """Build the cache key for an activity call with the given inputs."""
+        digest = hashlib.sha256(
+            f"{activity_type}:{job_id}:".encode() + orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        return f"activity:{digest}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        try:
+            client = await self._get_redis_client()
+            cached = await client.get(key)
+        except Exception as e:
+            logger.warning("Failed to read cached result", key=key, error=str(e))
+            return None
+
+        return orjson.loads(cached) if cached is not None else None
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """Cache value under key for ttl_seconds."""
+        try:
+            client = await self._get_redis_client()
+            await client.setex(key, ttl_seconds, orjson.dumps(value))
+        except Exception as e:
+            logger.warning("Failed to cache result", key=key, error=str(e))
+            # Don't raise - a cache write failure must not fail the activity
+
+
+# Global result cache instance
+result_cache = ResultCache()
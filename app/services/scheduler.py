@@ -144,10 +144,13 @@ def _signal_beat_restart():
         else:
             logger.warning("No Celery Beat processes found to restart")
             
-        # Create a restart marker file that the beat process can check
+        # Create a restart marker file that the beat process can check. It is
+        # written to a temp file and renamed into place so the watchdog never
+        # sees a partially written marker.
         restart_marker = "celerybeat-restart.marker"
-        with open(restart_marker, 'w') as f:
+        with open(f"{restart_marker}.tmp", 'w') as f:
             f.write(f"restart_requested_at={datetime.utcnow().isoformat()}")
+        os.replace(f"{restart_marker}.tmp", restart_marker)
         logger.info("Created restart marker file for Celery Beat")
         
         # Also try to start a new beat process if none are running
@@ -1,5 +1,5 @@
 from opentelemetry import trace
-from opentelemetry.exporter.jaeger.thrift import JaegerExporter
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -17,9 +17,22 @@ from app.config.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Resolved once at import so disabled tracing costs nothing per call
+_TRACING_ENABLED = settings.tracing_enabled
+
+# Shared non-recording span handed out when there is nothing to export to
+_NOOP_SPAN = trace.INVALID_SPAN
+
+# Module tracer shared by TracingContext instances (a proxy until a provider is set)
+_TRACER = trace.get_tracer(__name__)
+
 
 def setup_tracing():
-    """Set up OpenTelemetry tracing with Jaeger."""
+    """Set up OpenTelemetry tracing with an OTLP/gRPC exporter (viewed in Jaeger)."""
+    if not _TRACING_ENABLED:
+        logger.info("Distributed tracing disabled, skipping setup")
+        return
+    
     logger.info("Setting up distributed tracing")
     
     # Create resource
@@ -33,18 +46,23 @@ def setup_tracing():
     trace.set_tracer_provider(TracerProvider(resource=resource))
     tracer_provider = trace.get_tracer_provider()
     
-    # Configure Jaeger exporter
-    jaeger_exporter = JaegerExporter(
-        agent_host_name="localhost",
-        agent_port=6831,
-        collector_endpoint=settings.jaeger_endpoint,
+    # Configure OTLP exporter - Jaeger accepts OTLP natively, so the UI is unchanged
+    otlp_exporter = OTLPSpanExporter(
+        endpoint=settings.otlp_endpoint,
+        insecure=True,
     )
     
-    # Add span processor
-    span_processor = BatchSpanProcessor(jaeger_exporter)
+    # Add span processor (tuned for bursty workflow activity)
+    span_processor = BatchSpanProcessor(
+        otlp_exporter,
+        max_queue_size=settings.otel_bsp_max_queue_size,
+        schedule_delay_millis=settings.otel_bsp_schedule_delay_millis,
+        max_export_batch_size=settings.otel_bsp_max_export_batch_size,
+        export_timeout_millis=settings.otel_bsp_export_timeout_millis,
+    )
     tracer_provider.add_span_processor(span_processor)
     
-    logger.info("Distributed tracing configured with Jaeger")
+    logger.info("Distributed tracing configured with OTLP exporter", endpoint=settings.otlp_endpoint)
 
 
 def get_tracer(name: str):
@@ -56,29 +74,39 @@ def trace_async_function(operation_name: str = None):
     """Decorator to trace async functions."""
     
     def decorator(func: Callable) -> Callable:
+        if not _TRACING_ENABLED:
+            return func
+        
+        tracer = get_tracer(__name__)
+        span_name = operation_name or f"{func.__module__}.{func.__name__}"
+        attr_keys = {}  # kwarg name -> span attribute key
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            tracer = get_tracer(__name__)
-            span_name = operation_name or f"{func.__module__}.{func.__name__}"
-            
             with tracer.start_as_current_span(span_name) as span:
                 try:
-                    # Add function parameters as attributes
-                    if args:
-                        span.set_attribute("function.args_count", len(args))
-                    if kwargs:
-                        for key, value in kwargs.items():
-                            if isinstance(value, (str, int, float, bool)):
-                                span.set_attribute(f"function.arg.{key}", value)
+                    # Add function parameters as attributes (skipped for unsampled spans)
+                    if span.is_recording():
+                        attrs = {
+                            attr_keys.get(key) or attr_keys.setdefault(key, f"function.arg.{key}"): value
+                            for key, value in kwargs.items()
+                            if isinstance(value, (str, int, float, bool))
+                        }
+                        if args:
+                            attrs["function.args_count"] = len(args)
+                        if attrs:
+                            span.set_attributes(attrs)
                     
                     result = await func(*args, **kwargs)
                     span.set_attribute("function.success", True)
                     return result
                     
                 except Exception as e:
-                    span.set_attribute("function.success", False)
-                    span.set_attribute("function.error", str(e))
-                    span.record_exception(e)
+                    # Skip traceback formatting for spans that won't be exported
+                    if span.is_recording():
+                        span.set_attribute("function.success", False)
+                        span.set_attribute("function.error", str(e))
+                        span.record_exception(e)
                     raise
         
         return wrapper
@@ -89,29 +117,39 @@ def trace_function(operation_name: str = None):
     """Decorator to trace synchronous functions."""
     
     def decorator(func: Callable) -> Callable:
+        if not _TRACING_ENABLED:
+            return func
+        
+        tracer = get_tracer(__name__)
+        span_name = operation_name or f"{func.__module__}.{func.__name__}"
+        attr_keys = {}  # kwarg name -> span attribute key
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            tracer = get_tracer(__name__)
-            span_name = operation_name or f"{func.__module__}.{func.__name__}"
-            
             with tracer.start_as_current_span(span_name) as span:
                 try:
-                    # Add function parameters as attributes
-                    if args:
-                        span.set_attribute("function.args_count", len(args))
-                    if kwargs:
-                        for key, value in kwargs.items():
-                            if isinstance(value, (str, int, float, bool)):
-                                span.set_attribute(f"function.arg.{key}", value)
+                    # Add function parameters as attributes (skipped for unsampled spans)
+                    if span.is_recording():
+                        attrs = {
+                            attr_keys.get(key) or attr_keys.setdefault(key, f"function.arg.{key}"): value
+                            for key, value in kwargs.items()
+                            if isinstance(value, (str, int, float, bool))
+                        }
+                        if args:
+                            attrs["function.args_count"] = len(args)
+                        if attrs:
+                            span.set_attributes(attrs)
                     
                     result = func(*args, **kwargs)
                     span.set_attribute("function.success", True)
                     return result
                     
                 except Exception as e:
-                    span.set_attribute("function.success", False)
-                    span.set_attribute("function.error", str(e))
-                    span.record_exception(e)
+                    # Skip traceback formatting for spans that won't be exported
+                    if span.is_recording():
+                        span.set_attribute("function.success", False)
+                        span.set_attribute("function.error", str(e))
+                        span.record_exception(e)
                     raise
         
         return wrapper
@@ -119,33 +157,50 @@ def trace_function(operation_name: str = None):
 
 
 class TracingContext:
-    """Context manager for manual tracing."""
+    """Context manager for manual tracing (re-entrant; no-op when tracing is off)."""
     
     def __init__(self, operation_name: str, **attributes):
-        self.tracer = get_tracer(__name__)
+        self.tracer = _TRACER
         self.operation_name = operation_name
         self.attributes = attributes
         self.span = None
+        self._spans = []
     
     def __enter__(self):
+        if not _TRACING_ENABLED:
+            self.span = _NOOP_SPAN
+            self._spans.append(_NOOP_SPAN)
+            return _NOOP_SPAN
+        
         self.span = self.tracer.start_span(self.operation_name)
+        self._spans.append(self.span)
         
-        # Set initial attributes
-        for key, value in self.attributes.items():
-            if isinstance(value, (str, int, float, bool)):
-                self.span.set_attribute(key, value)
+        # Set initial attributes in a single call
+        if self.span.is_recording():
+            attrs = {
+                key: value for key, value in self.attributes.items()
+                if isinstance(value, (str, int, float, bool))
+            }
+            if attrs:
+                self.span.set_attributes(attrs)
         
         return self.span
     
     def __exit__(self, exc_type, exc_val, exc_tb):
+        span = self._spans.pop()
+        self.span = self._spans[-1] if self._spans else None
+        
+        if span is _NOOP_SPAN:
+            return
+        
         if exc_type:
-            self.span.set_attribute("error", True)
-            self.span.set_attribute("error_message", str(exc_val))
-            self.span.record_exception(exc_val)
+            span.set_attribute("error", True)
+            span.set_attribute("error_message", str(exc_val))
+            span.record_exception(exc_val)
         else:
-            self.span.set_attribute("success", True)
+            span.set_attribute("success", True)
         
-        self.span.end()
+        span.end()
 
 
 def instrument_fastapi(app):
@@ -3,10 +3,11 @@ Workflow status synchronization service.
 Handles syncing job status between Celery tasks, database, and UI updates.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, case, func, select, update
 
 from app.config.database import SessionLocal  
 from app.config.logging import get_logger
@@ -15,12 +16,29 @@ from app.services.redis_stream import redis_stream_service
 
 logger = get_logger(__name__)
 
+# Window for coalescing rapid status transitions of a job into one Redis publish
+PUBLISH_BATCH_WINDOW_SECONDS = 0.05
+TERMINAL_STATUSES = ("completed", "failed", "terminated")
+
+# Static status messages ("failed" is built per call since it includes the error)
+_STATUS_MESSAGES = {
+    "started": "Workflow is starting...",
+    "scraping": "Scraping news articles...",
+    "summarizing": "Generating summaries...",
+    "analyzing": "Performing analysis...",
+    "completed": "Workflow completed successfully",
+    "terminated": "Workflow was terminated"
+}
+
 
 class WorkflowStatusSync:
     """Service for synchronizing workflow status across systems."""
     
     def __init__(self):
-        pass  # No temporal client needed anymore
+        # Redis publishing is batched by a background worker bound to the running loop
+        self._publish_queue: Optional[asyncio.Queue] = None
+        self._publish_task: Optional[asyncio.Task] = None
+        self._publish_loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def update_job_status(
         self,
@@ -41,45 +59,18 @@ class WorkflowStatusSync:
             additional_data: Optional additional data to include in updates
         """
         try:
-            # Update database
-            with SessionLocal() as db:
-                job = db.query(NewsJob).filter(NewsJob.job_id == job_id).first()
-                
-                if not job:
-                    logger.warning(f"Job {job_id} not found in database for status update")
-                    return False
-                
-                # Update job fields
-                old_status = job.status
-                job.status = status
-                
-                if task_id:
-                    job.workflow_run_id = task_id  # Reuse this field for Celery task ID
-                
-                if error_message:
-                    job.error_message = error_message
-                
-                # Set completion timestamp if completed or failed
-                if status in ["completed", "failed", "terminated"] and not job.completed_at:
-                    job.completed_at = datetime.utcnow()
-                
-                db.commit()
-                
-                logger.info(f"Updated job {job_id} status: {old_status} -> {status}")
-        
-            # Publish update to Redis stream for real-time UI updates
-            message = self._get_status_message(status, error_message)
-            update_data = {
-                "type": "job_status_update",
-                "job_id": job_id, 
-                "status": status,
-                "message": message
-            }
-            
-            if additional_data:
-                update_data.update(additional_data)
+            # Run the blocking DB write in a worker thread so the event loop stays free
+            updated = await asyncio.to_thread(
+                self._apply_status_update, job_id, status, error_message, task_id
+            )
+            if not updated:
+                return False
             
-            await redis_stream_service.publish_update(update_data)
+            # Queue update for the Redis stream (real-time UI updates); the publish
+            # worker coalesces rapid transitions of the same job into one publish
+            self._enqueue_publish(
+                self._build_update(job_id, status, error_message, additional_data)
+            )
             
             return True
             
@@ -87,18 +78,149 @@ class WorkflowStatusSync:
             logger.error(f"Failed to update job status for {job_id}: {e}")
             return False
     
+    def _apply_status_update(
+        self,
+        job_id: str,
+        status: str,
+        error_message: Optional[str] = None,
+        task_id: Optional[str] = None
+    ) -> bool:
+        """
+        Apply a job status update to the database (blocking).
+        
+        Returns:
+            True if the job row was updated, False if it was not found
+        """
+        # Build job field updates
+        values = {"status": status}
+        
+        if task_id:
+            values["workflow_run_id"] = task_id  # Reuse this field for Celery task ID
+        
+        if error_message:
+            values["error_message"] = error_message
+        
+        # Set completion timestamp if completed or failed (keep an existing one)
+        if status in ["completed", "failed", "terminated"]:
+            values["completed_at"] = func.coalesce(NewsJob.completed_at, datetime.utcnow())
+        
+        # Update database with a single UPDATE ... RETURNING (no row load).
+        # RETURNING only sees the new row, so the previous status is read
+        # from a locked self-join in the same statement.
+        previous = (
+            select(NewsJob.id, NewsJob.status)
+            .where(NewsJob.job_id == job_id)
+            .with_for_update()
+            .subquery()
+        )
+        with SessionLocal() as db:
+            row = db.execute(
+                update(NewsJob)
+                .where(NewsJob.id == previous.c.id)
+                .values(**values)
+                .returning(previous.c.status)
+                .execution_options(synchronize_session=False)
+            ).first()
+            
+            if row is None:
+                logger.warning(f"Job {job_id} not found in database for status update")
+                return False
+            
+            db.commit()
+            
+            logger.info(f"Updated job {job_id} status: {row.status} -> {status}")
+        
+        return True
+    
+    def _build_update(
+        self,
+        job_id: str,
+        status: str,
+        error_message: Optional[str] = None,
+        additional_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build a queued Redis stream update for a job status change."""
+        data = {"type": "job_status_update"}
+        if additional_data:
+            data.update(additional_data)
+        
+        return {
+            "job_id": job_id,
+            "status": status,
+            "message": self._get_status_message(status, error_message),
+            "data": data
+        }
+    
+    def _enqueue_publish(self, update: Dict[str, Any]):
+        """Queue a status update for the background Redis publish worker."""
+        loop = asyncio.get_running_loop()
+        
+        # (Re)start the worker if this is the first update on this event loop
+        if self._publish_task is None or self._publish_task.done() or self._publish_loop is not loop:
+            self._publish_queue = asyncio.Queue()
+            self._publish_loop = loop
+            self._publish_task = loop.create_task(self._publish_worker())
+        
+        self._publish_queue.put_nowait(update)
+    
+    async def _publish_worker(self):
+        """Drain queued status updates, publishing at most once per job per batch window."""
+        queue = self._publish_queue
+        
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(PUBLISH_BATCH_WINDOW_SECONDS)
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            pending = {}
+            for update in batch:
+                existing = pending.get(update["job_id"])
+                pending[update["job_id"]] = self._merge_updates(existing, update) if existing else update
+            
+            try:
+                await redis_stream_service.publish_updates(list(pending.values()))
+            except Exception as e:
+                logger.error(f"Failed to publish status updates: {e}")
+            finally:
+                # Lets close() wait until everything queued has been published
+                for _ in batch:
+                    queue.task_done()
+    
+    async def close(self):
+        """Publish status updates still waiting in the batch window and stop the publish worker."""
+        task = self._publish_task
+        if task is None:
+            return
+        
+        if not task.done() and self._publish_loop is asyncio.get_running_loop():
+            await self._publish_queue.join()
+        task.cancel()
+        
+        self._publish_task = None
+        self._publish_queue = None
+        self._publish_loop = None
+    
+    def _merge_updates(self, older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge two queued updates for the same job, keeping the newest terminal status."""
+        latest = older if (
+            older["status"] in TERMINAL_STATUSES and newer["status"] not in TERMINAL_STATUSES
+        ) else newer
+        
+        return {
+            "job_id": latest["job_id"],
+            "status": latest["status"],
+            "message": latest["message"],
+            "data": {**older["data"], **newer["data"]}
+        }
+    
     def _get_status_message(self, status: str, error_message: Optional[str] = None) -> str:
         """Generate appropriate status message."""
-        messages = {
-            "started": "Workflow is starting...",
-            "scraping": "Scraping news articles...",
-            "summarizing": "Generating summaries...",
-            "analyzing": "Performing analysis...",
-            "completed": "Workflow completed successfully",
-            "failed": f"Workflow failed: {error_message}" if error_message else "Workflow failed",
-            "terminated": "Workflow was terminated"
-        }
-        return messages.get(status, f"Workflow status updated: {status}")
+        if status == "failed":
+            return f"Workflow failed: {error_message}" if error_message else "Workflow failed"
+        
+        message = _STATUS_MESSAGES.get(status)
+        return message if message is not None else f"Workflow status updated: {status}"
     
     async def sync_stale_jobs(self, max_age_hours: int = 2) -> Dict[str, Any]:
         """
@@ -114,48 +236,29 @@ class WorkflowStatusSync:
             from datetime import timedelta
             cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
             
-            with SessionLocal() as db:
-                # Find jobs that are stuck in 'started' state
-                stale_jobs = db.query(NewsJob).filter(
-                    and_(
-                        NewsJob.status == "started",
-                        NewsJob.created_at < cutoff_time
-                    )
-                ).all()
-                
-                sync_results = {
-                    "total_stale_jobs": len(stale_jobs),
-                    "synced_jobs": 0,
-                    "failed_syncs": 0,
-                    "job_details": []
-                }
-                
-                for job in stale_jobs:
-                    try:
-                        # For stale jobs, mark as completed (they likely finished)
-                        # In a real implementation with Celery, you'd query task status
-                        success = await self.update_job_status(
-                            job_id=job.job_id,
-                            status="completed"
-                        )
-                        
-                        if success:
-                            sync_results["synced_jobs"] += 1
-                            sync_results["job_details"].append({
-                                "job_id": job.job_id,
-                                "status": "synced",
-                                "age_hours": (datetime.utcnow() - job.created_at).total_seconds() / 3600
-                            })
-                        else:
-                            sync_results["failed_syncs"] += 1
-                            
-                    except Exception as e:
-                        logger.error(f"Failed to sync job {job.job_id}: {e}")
-                        sync_results["failed_syncs"] += 1
-                
-                logger.info(f"Stale job sync completed: {sync_results['synced_jobs']} synced, {sync_results['failed_syncs']} failed")
-                return sync_results
-                
+            # For stale jobs, mark as completed (they likely finished) in one bulk UPDATE.
+            # In a real implementation with Celery, you'd query task status
+            stale_jobs = await asyncio.to_thread(self._complete_stale_jobs, cutoff_time)
+            
+            now = datetime.utcnow()
+            sync_results = {
+                "total_stale_jobs": len(stale_jobs),
+                "synced_jobs": len(stale_jobs),
+                "failed_syncs": 0,
+                "job_details": []
+            }
+            
+            for job_id, created_at in stale_jobs:
+                sync_results["job_details"].append({
+                    "job_id": job_id,
+                    "status": "synced",
+                    "age_hours": (now - created_at).total_seconds() / 3600
+                })
+                self._enqueue_publish(self._build_update(job_id, "completed"))
+            
+            logger.info(f"Stale job sync completed: {sync_results['synced_jobs']} synced, {sync_results['failed_syncs']} failed")
+            return sync_results
+            
         except Exception as e:
             logger.error(f"Error during stale job sync: {e}")
             return {
@@ -165,6 +268,31 @@ class WorkflowStatusSync:
                 "error": str(e)
             }
     
+    def _complete_stale_jobs(self, cutoff_time: datetime) -> List[tuple]:
+        """
+        Mark jobs stuck in 'started' state since before cutoff_time as completed (blocking).
+        
+        Returns:
+            List of (job_id, created_at) tuples for the updated jobs
+        """
+        with SessionLocal() as db:
+            result = db.execute(
+                update(NewsJob)
+                .where(
+                    and_(
+                        NewsJob.status == "started",
+                        NewsJob.created_at < cutoff_time
+                    )
+                )
+                .values(status="completed", completed_at=datetime.utcnow())
+                .returning(NewsJob.job_id, NewsJob.created_at)
+                .execution_options(synchronize_session=False)
+            )
+            stale_jobs = [tuple(row) for row in result.all()]
+            db.commit()
+        
+        return stale_jobs
+    
     async def get_workflow_health_status(self) -> Dict[str, Any]:
         """
         Get overall health status of workflows.
@@ -176,21 +304,30 @@ class WorkflowStatusSync:
             with SessionLocal() as db:
                 from datetime import timedelta
                 
-                # Get job counts by status
-                total_jobs = db.query(NewsJob).count()
-                completed_jobs = db.query(NewsJob).filter(NewsJob.status == "completed").count()
-                failed_jobs = db.query(NewsJob).filter(NewsJob.status == "failed").count()
-                started_jobs = db.query(NewsJob).filter(NewsJob.status == "started").count()
-                
-                # Get recent activity (last 24 hours)
+                # Get job counts by status and recent activity (last 24 hours)
+                # in a single aggregate query
                 yesterday = datetime.utcnow() - timedelta(hours=24)
-                recent_jobs = db.query(NewsJob).filter(NewsJob.created_at >= yesterday).count()
-                recent_completed = db.query(NewsJob).filter(
-                    and_(
-                        NewsJob.created_at >= yesterday,
-                        NewsJob.status == "completed"
-                    )
-                ).count()
+                (
+                    total_jobs,
+                    completed_jobs,
+                    failed_jobs,
+                    started_jobs,
+                    recent_jobs,
+                    recent_completed
+                ) = db.query(
+                    func.count(NewsJob.id),
+                    func.count(case((NewsJob.status == "completed", 1))),
+                    func.count(case((NewsJob.status == "failed", 1))),
+                    func.count(case((NewsJob.status == "started", 1))),
+                    func.count(case((NewsJob.created_at >= yesterday, 1))),
+                    func.count(case((
+                        and_(
+                            NewsJob.created_at >= yesterday,
+                            NewsJob.status == "completed"
+                        ),
+                        1
+                    )))
+                ).one()
                 
                 # Calculate health metrics
                 success_rate = (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0
@@ -253,24 +390,66 @@ class WorkflowStatusSync:
         Returns:
             True if successfully terminated
         """
+        terminated = await self.terminate_jobs([job_id], reason)
+        return job_id in terminated
+    
+    async def terminate_jobs(self, job_ids: List[str], reason: str = "Manual termination") -> List[str]:
+        """
+        Terminate several running jobs with one DB update and one Redis round trip.
+        
+        Args:
+            job_ids: Jobs to terminate
+            reason: Reason for termination
+            
+        Returns:
+            IDs of the jobs that were terminated
+        """
+        if not job_ids:
+            return []
+        
         try:
             # Update database status
-            success = await self.update_job_status(
-                job_id=job_id,
-                status="terminated",
-                error_message=reason
-            )
+            terminated = await asyncio.to_thread(self._terminate_jobs_in_db, job_ids, reason)
             
-            if success:
-                logger.info(f"Job {job_id} terminated: {reason}")
-                return True
-            else:
+            for job_id in set(job_ids) - set(terminated):
                 logger.error(f"Failed to terminate job {job_id}")
-                return False
-                
+            
+            await redis_stream_service.publish_updates([
+                self._build_update(job_id, "terminated", reason) for job_id in terminated
+            ])
+            
+            for job_id in terminated:
+                logger.info(f"Job {job_id} terminated: {reason}")
+            
+            return terminated
+            
         except Exception as e:
-            logger.error(f"Error terminating job {job_id}: {e}")
-            return False
+            logger.error(f"Error terminating jobs {job_ids}: {e}")
+            return []
+    
+    def _terminate_jobs_in_db(self, job_ids: List[str], reason: str) -> List[str]:
+        """
+        Mark jobs as terminated in the database (blocking).
+        
+        Returns:
+            IDs of the jobs that were found and updated
+        """
+        with SessionLocal() as db:
+            result = db.execute(
+                update(NewsJob)
+                .where(NewsJob.job_id.in_(job_ids))
+                .values(
+                    status="terminated",
+                    error_message=reason,
+                    completed_at=func.coalesce(NewsJob.completed_at, datetime.utcnow())
+                )
+                .returning(NewsJob.job_id)
+                .execution_options(synchronize_session=False)
+            )
+            terminated = list(result.scalars().all())
+            db.commit()
+        
+        return terminated
 
 
 # Singleton instance for use across the application
@@ -303,4 +482,14 @@ async def get_workflow_health() -> Dict[str, Any]:
 
 async def terminate_job(job_id: str, reason: str = "Manual termination") -> bool:
     """Terminate a running job."""
-    return await workflow_status_sync.terminate_job(job_id, reason)
\ No newline at end of file
+    return await workflow_status_sync.terminate_job(job_id, reason)
+
+
+async def terminate_jobs(job_ids: List[str], reason: str = "Manual termination") -> List[str]:
+    """Terminate several running jobs."""
+    return await workflow_status_sync.terminate_jobs(job_ids, reason)
+
+
+async def close_status_sync():
+    """Flush pending status updates to Redis and stop the publish worker."""
+    await workflow_status_sync.close()
@@ -0,0 +1,63 @@
+"""
+Temporal data converter backed by orjson.
+
+Workflow and activity payloads (article and summary lists) are encoded with
+orjson instead of the standard library json module. Payloads keep the
+"json/plain" encoding, so they stay readable by the Temporal UI and by
+workers using the default converter.
+"""
+
+import dataclasses
+from typing import Any, Optional, Type
+
+import orjson
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import (
+    AdvancedJSONEncoder,
+    CompositePayloadConverter,
+    DataConverter,
+    DefaultPayloadConverter,
+    JSONPlainPayloadConverter,
+    value_to_type,
+)
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+# Fallback for types orjson cannot serialize natively (e.g. pydantic models)
+_fallback_encoder = AdvancedJSONEncoder()
+
+
+class OrjsonPlainPayloadConverter(JSONPlainPayloadConverter):
+    """JSON payload converter that encodes and decodes with orjson."""
+    
+    def to_payload(self, value: Any) -> Optional[Payload]:
+        return Payload(
+            metadata={"encoding": self.encoding.encode()},
+            data=orjson.dumps(value, default=_fallback_encoder.default, option=ORJSON_OPTIONS),
+        )
+    
+    def from_payload(self, payload: Payload, type_hint: Optional[Type] = None) -> Any:
+        try:
+            obj = orjson.loads(payload.data)
+            if type_hint:
+                obj = value_to_type(type_hint, obj, self._custom_type_converters)
+            return obj
+        except orjson.JSONDecodeError as err:
+            raise RuntimeError("Failed parsing") from err
+
+
+class OrjsonPayloadConverter(CompositePayloadConverter):
+    """Default Temporal payload converter with JSON handled by orjson."""
+    
+    def __init__(self) -> None:
+        super().__init__(*(
+            OrjsonPlainPayloadConverter() if isinstance(converter, JSONPlainPayloadConverter) else converter
+            for converter in DefaultPayloadConverter.default_encoding_payload_converters
+        ))
+
+
+# Data converter shared by the Temporal client and worker
+orjson_data_converter = dataclasses.replace(
+    DataConverter.default,
+    payload_converter_class=OrjsonPayloadConverter,
+)
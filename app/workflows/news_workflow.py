@@ -1,7 +1,122 @@
-from datetime import timedelta
+import asyncio
+import functools
+import random
+import re
+from datetime import datetime, timedelta
 from temporalio import workflow, activity
 from temporalio.common import RetryPolicy
-from typing import List, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Activity dependencies are passed through the workflow sandbox so they are
+# imported once per worker process instead of on every activity call
+with workflow.unsafe.imports_passed_through():
+    from sqlalchemy import update
+    from app.agents.scraper_agent import ScraperAgent, MAX_ARTICLES_PER_JOB
+    from app.agents.summarizer_agent import SummarizerAgent
+    from app.agents.critic_agent import CriticAgent
+    from app.agents.analyst_agent import AnalystAgent
+    from app.config.database import SessionLocal
+    from app.config.settings import get_settings
+    from app.services.job_result_store import encode_result
+    from app.services.metrics import WORKFLOW_ERRORS
+    from app.services.payload_store import payload_store
+    from app.services.result_cache import result_cache
+    from app.models.news import NewsJob
+
+# Error type -> message keyword pattern, checked in priority order
+ERROR_TYPE_PATTERNS = (
+    ("temporal", re.compile(r"temporal", re.IGNORECASE)),
+    ("llm", re.compile(r"ollama|groq|llm", re.IGNORECASE)),
+    ("database", re.compile(r"database", re.IGNORECASE)),
+    ("scraping", re.compile(r"scraping|rss", re.IGNORECASE)),
+)
+
+# Errors that indicate a bug or bad input rather than a transient failure
+NON_RETRYABLE_ERROR_TYPES = ["ValueError", "KeyError"]
+
+# Activity retry policies with exponential backoff
+SCRAPE_RETRY_POLICY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=30),
+    maximum_attempts=3,
+    non_retryable_error_types=NON_RETRYABLE_ERROR_TYPES
+)
+LLM_RETRY_POLICY = RetryPolicy(
+    initial_interval=timedelta(seconds=2),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=60),
+    maximum_attempts=3,
+    non_retryable_error_types=NON_RETRYABLE_ERROR_TYPES
+)
+CRITIQUE_RETRY_POLICY = RetryPolicy(
+    initial_interval=timedelta(seconds=2),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=60),
+    maximum_attempts=2,  # Fewer retries since this is optional improvement
+    non_retryable_error_types=NON_RETRYABLE_ERROR_TYPES
+)
+
+# LLM activities heartbeat after every item. The heartbeat timeout sits above
+# the slowest single item (several Groq calls with a 30s timeout each), so a
+# stalled activity is retried quickly without tripping on normal work.
+LLM_HEARTBEAT_TIMEOUT = timedelta(seconds=90)
+LLM_SCHEDULE_TO_CLOSE_TIMEOUT = timedelta(minutes=45)
+
+# Full-jitter delay at the start of a retried activity attempt, so parallel
+# batches don't hit the RSS/LLM endpoints again in lockstep
+RETRY_JITTER_BASE_SECONDS = 1.0
+RETRY_JITTER_MAX_SECONDS = 30.0
+
+# Task queue for the fast DB-only job status activities, served by a separate
+# worker so they are never stuck behind long-running LLM activities
+TASK_QUEUE_IO = "news-io"
+
+# Default number of items per summarize/critique/analyze activity batch
+DEFAULT_BATCH_SIZE = 8
+
+# Default number of feed groups scraped as separate activities
+DEFAULT_SCRAPE_GROUPS = 5
+
+# Default cap on article batches processed at the same time
+DEFAULT_MAX_PARALLEL_BATCHES = 4
+
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    """Split items into consecutive batches of at most `size` items."""
+    size = max(1, size)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _with_retry_jitter(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Sleep a random full-jitter delay before running a retry attempt of the activity."""
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Jittering the retry itself (not the failure) means no delay is spent
+        # after the last attempt, when nothing will run again
+        attempt = activity.info().attempt
+        if attempt > 1:
+            await asyncio.sleep(random.uniform(
+                0, min(RETRY_JITTER_BASE_SECONDS * 2 ** (attempt - 2), RETRY_JITTER_MAX_SECONDS)
+            ))
+        return await func(*args, **kwargs)
+    return wrapper
+
+
+def _memoize_result(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Return the stored result of an earlier run of the activity with the same job and inputs."""
+    @functools.wraps(func)
+    async def wrapper(job_id: str, *args: Any, **kwargs: Any) -> Any:
+        cache_key = result_cache.activity_key(activity.info().activity_type, job_id, [args, kwargs])
+        cached = await result_cache.get(cache_key)
+        if cached is not None:
+            activity.logger.info(f"Using stored result for {cache_key}")
+            return cached
+        
+        result = await func(job_id, *args, **kwargs)
+        await result_cache.set(cache_key, result, get_settings().activity_result_ttl_seconds)
+        return result
+    return wrapper
 
 
 @workflow.defn
@@ -11,94 +126,112 @@ class NewsWorkflow:
     """
     
     @workflow.run
-    async def run(self, job_id: str, target_date: str = None) -> Dict[str, Any]:
+    async def run(
+        self,
+        job_id: str,
+        target_date: str = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        scrape_groups: int = DEFAULT_SCRAPE_GROUPS,
+        max_parallel_batches: int = DEFAULT_MAX_PARALLEL_BATCHES
+    ) -> Dict[str, Any]:
         """
         Run the complete news workflow.
         
+        Feeds are scraped in parallel groups, then the articles of all groups
+        are deduplicated, capped and saved once before being summarized,
+        critiqued and analyzed in parallel batches.
+        
         Args:
             job_id: Unique job identifier
             target_date: Target date for scraping in YYYY-MM-DD format
+            batch_size: Items per summarize/critique/analyze activity
+            scrape_groups: Number of feed groups scraped as separate activities
+            max_parallel_batches: Maximum article batches processed at the same time
         """
         workflow.logger.info(f"Starting news workflow for job {job_id}")
         
         try:
-            # Step 1: Scrape news articles
+            # Step 1: Scrape the feed groups in parallel
             workflow.logger.info("Starting scraping step", extra={"target_date": target_date})
-            scraper_result = await workflow.execute_activity(
-                scrape_news,
-                args=[job_id, target_date],
-                start_to_close_timeout=timedelta(minutes=10),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=1),
-                    maximum_interval=timedelta(seconds=30),
-                    maximum_attempts=3
+            group_count = max(1, scrape_groups)
+            group_results = await asyncio.gather(*[
+                workflow.execute_activity(
+                    scrape_news_batch,
+                    args=[job_id, target_date, group_index, group_count],
+                    start_to_close_timeout=timedelta(minutes=10),
+                    retry_policy=SCRAPE_RETRY_POLICY
                 )
+                for group_index in range(group_count)
+            ])
+            
+            # Step 2: Deduplicate across all groups, apply the per-job cap and save once
+            scraper_result = await workflow.execute_activity(
+                save_scraped_articles,
+                args=[job_id, [scraped_id for result in group_results for scraped_id in result["scraped_ids"]]],
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=SCRAPE_RETRY_POLICY
             )
+            article_ids = scraper_result.get("article_ids", [])
+            articles_count = len(article_ids)
             
             # Check if we got any articles
-            if not scraper_result.get("articles"):
+            if not articles_count:
                 workflow.logger.warning("No articles found")
-                return {"status": "completed", "articles_count": 0}
+                return self._completed_result(job_id, articles_count=0)
             
-            # Step 2: Summarize articles
-            workflow.logger.info(f"Starting summarization step, articles_count={len(scraper_result['articles'])}")
-            summary_result = await workflow.execute_activity(
-                summarize_news,
-                args=[job_id, scraper_result["articles"]],
-                start_to_close_timeout=timedelta(minutes=15),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=2),
-                    maximum_interval=timedelta(seconds=60),
-                    maximum_attempts=3
-                )
-            )
+            # Steps 3-4: Run the articles through summarize -> critique -> analyze batches
+            semaphore = asyncio.Semaphore(max(1, max_parallel_batches))
+            batch_results = await asyncio.gather(*[
+                self._process_batch(job_id, batch, semaphore)
+                for batch in _chunks(article_ids, batch_size)
+            ])
+            summary_ids = [summary_id for batch in batch_results for summary_id in batch["summary_ids"]]
+            improved_summary_ids = [summary_id for batch in batch_results for summary_id in batch["improved_summary_ids"]]
+            critiques = [critique for batch in batch_results for critique in batch["critiques"]]
+            analyses = [analysis for batch in batch_results for analysis in batch["analyses"]]
+            processing_times = [batch["processing_time"] for batch in batch_results]
             
-            # Step 3: Critique and improve summaries
-            workflow.logger.info("Starting critique step")
-            critique_result = await workflow.execute_activity(
-                critique_summaries,
-                args=[job_id, summary_result["summaries"]],
-                start_to_close_timeout=timedelta(minutes=12),  # Slightly longer for review process
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=2),
-                    maximum_interval=timedelta(seconds=60),
-                    maximum_attempts=2  # Fewer retries since this is optional improvement
+            # Overall trends analysis needs every improved summary, so it runs last
+            if improved_summary_ids:
+                workflow.logger.info("Starting overall trends analysis")
+                trends_result = await workflow.execute_activity(
+                    analyze_overall_trends,
+                    args=[job_id, improved_summary_ids],
+                    start_to_close_timeout=timedelta(minutes=10),
+                    retry_policy=LLM_RETRY_POLICY
                 )
-            )
+                analyses.extend(trends_result["analyses"])
+                processing_times.append(trends_result.get("total_processing_time", 0))
             
-            # Step 4: Analyze improved summaries
-            workflow.logger.info("Starting analysis step")
-            analysis_result = await workflow.execute_activity(
-                analyze_news,
-                args=[job_id, critique_result["improved_summaries"]],
-                start_to_close_timeout=timedelta(minutes=10),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=2),
-                    maximum_interval=timedelta(seconds=60),
-                    maximum_attempts=3
-                )
+            # Step 5: Persist the full result (articles and summaries are persisted by
+            # the agents, so only their IDs are included)
+            full_result = self._completed_result(
+                job_id,
+                articles_count=articles_count,
+                summary_ids=summary_ids,
+                improved_summary_ids=improved_summary_ids,
+                critiques=critiques,
+                analyses=analyses,
+                processing_time=max(processing_times, default=0),
+                critique_processing_time=max((batch["critique_processing_time"] for batch in batch_results), default=0)
+            )
+            result_ptr = await workflow.execute_activity(
+                persist_final_result,
+                args=[job_id, full_result],
+                task_queue=TASK_QUEUE_IO,
+                start_to_close_timeout=timedelta(minutes=2)
             )
             
-            # Step 5: Mark job as completed in database
+            # Step 6: Mark job as completed in database
             await workflow.execute_activity(
                 mark_job_completed,
                 args=[job_id],
+                task_queue=TASK_QUEUE_IO,
                 start_to_close_timeout=timedelta(minutes=2)
             )
             
-            # Step 6: Return final result
-            final_result = {
-                "job_id": job_id,
-                "status": "completed",
-                "articles": scraper_result["articles"],
-                "summaries": summary_result["summaries"],
-                "improved_summaries": critique_result["improved_summaries"],
-                "critiques": critique_result["critiques"],
-                "analyses": analysis_result["analyses"],
-                "processing_time": analysis_result.get("total_processing_time", 0),
-                "critique_processing_time": critique_result.get("total_processing_time", 0),
-                "completed_at": workflow.now().isoformat()
-            }
+            # Step 7: Return only a pointer to the persisted result
+            final_result = self._completed_result(job_id, articles_count=articles_count, result_ptr=result_ptr)
             
             workflow.logger.info("News workflow completed successfully")
             return final_result
@@ -110,6 +243,7 @@ class NewsWorkflow:
             await workflow.execute_activity(
                 mark_job_failed,
                 args=[job_id, str(e)],
+                task_queue=TASK_QUEUE_IO,
                 start_to_close_timeout=timedelta(minutes=2)
             )
             
@@ -119,103 +253,218 @@ class NewsWorkflow:
                 "error": str(e),
                 "failed_at": workflow.now().isoformat()
             }
+    
+    async def _process_batch(
+        self,
+        job_id: str,
+        article_ids: List[str],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Summarize one batch of articles, then critique and analyze the summaries in parallel."""
+        async with semaphore:
+            summary_result = await workflow.execute_activity(
+                summarize_news,
+                args=[job_id, article_ids],
+                start_to_close_timeout=timedelta(minutes=15),
+                schedule_to_close_timeout=LLM_SCHEDULE_TO_CLOSE_TIMEOUT,
+                heartbeat_timeout=LLM_HEARTBEAT_TIMEOUT,
+                retry_policy=LLM_RETRY_POLICY
+            )
+            
+            # Critique only polishes the prose, so analysis runs on the original
+            # summaries alongside it. Overall trends are analyzed once across all
+            # batches by the workflow.
+            critique_task = workflow.start_activity(
+                critique_summaries,
+                args=[job_id, summary_result["summary_ids"]],
+                start_to_close_timeout=timedelta(minutes=12),  # Slightly longer for review process
+                schedule_to_close_timeout=LLM_SCHEDULE_TO_CLOSE_TIMEOUT,
+                heartbeat_timeout=LLM_HEARTBEAT_TIMEOUT,
+                retry_policy=CRITIQUE_RETRY_POLICY
+            )
+            analysis_task = workflow.start_activity(
+                analyze_news,
+                args=[job_id, summary_result["summary_ids"], False],
+                start_to_close_timeout=timedelta(minutes=10),
+                schedule_to_close_timeout=LLM_SCHEDULE_TO_CLOSE_TIMEOUT,
+                heartbeat_timeout=LLM_HEARTBEAT_TIMEOUT,
+                retry_policy=LLM_RETRY_POLICY
+            )
+            critique_result, analysis_result = await asyncio.gather(critique_task, analysis_task)
+        
+        return {
+            "summary_ids": summary_result["summary_ids"],
+            "improved_summary_ids": critique_result["improved_summary_ids"],
+            "critiques": critique_result["critiques"],
+            "analyses": analysis_result["analyses"],
+            "critique_processing_time": critique_result.get("total_processing_time", 0),
+            "processing_time": analysis_result.get("total_processing_time", 0)
+        }
+    
+    def _completed_result(self, job_id: str, articles_count: int, **extras: Any) -> Dict[str, Any]:
+        """Build the workflow result for a completed run."""
+        return {
+            "job_id": job_id,
+            "status": "completed",
+            "articles_count": articles_count,
+            "completed_at": workflow.now().isoformat(),
+            **extras
+        }
 
 
 # Activity functions
 @activity.defn
-async def scrape_news(job_id: str, target_date: str = None) -> Dict[str, Any]:
-    """Scrape news articles from configured RSS feeds."""
-    from app.agents.scraper_agent import ScraperAgent
+@_with_retry_jitter
+async def scrape_news_batch(job_id: str, target_date: str, group_index: int, group_count: int) -> Dict[str, Any]:
+    """Scrape one group of the configured RSS feeds without deduplicating or saving the articles."""
+    agent = ScraperAgent(job_id)
+    if group_index == 0:
+        # The groups start together, so one of them announces the scrape
+        await agent.publish_scraping_started()
+    
+    # Contiguous slices, so the groups' articles concatenate back into feed order
+    feeds = _configured_feeds()
+    feed_group = feeds[group_index * len(feeds) // group_count:(group_index + 1) * len(feeds) // group_count]
+    articles = await agent.scrape(target_date, feed_urls=feed_group) if feed_group else []
+    
+    # Payload IDs only need to be unique within the job until the articles are saved
+    for article_index, article in enumerate(articles):
+        article["id"] = f"{group_index}:{article_index}"
     
+    return {"scraped_ids": await payload_store.store_items(job_id, "scraped_articles", articles)}
+
+
+@activity.defn
+@_with_retry_jitter
+async def save_scraped_articles(job_id: str, scraped_ids: List[str]) -> Dict[str, Any]:
+    """Deduplicate the scraped articles of all feed groups, cap them per job and save them."""
+    articles = await payload_store.load_items(job_id, "scraped_articles", scraped_ids)
     agent = ScraperAgent(job_id)
-    result = await agent.run(target_date)
+    result = await agent.select_articles(articles, MAX_ARTICLES_PER_JOB)
     
+    return await _store_articles(job_id, result)
+
+
+def _configured_feeds() -> List[str]:
+    """Return the configured RSS feed URLs."""
+    return [feed.strip() for feed in get_settings().rss_feeds.split(",") if feed.strip()]
+
+
+async def _store_articles(job_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Move scraped articles into the payload store, keeping only their IDs in the result."""
+    result["article_ids"] = await payload_store.store_items(job_id, "articles", result.pop("articles"))
     return result
 
 
 @activity.defn
-async def summarize_news(job_id: str, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+@_with_retry_jitter
+@_memoize_result
+async def summarize_news(job_id: str, article_ids: List[str]) -> Dict[str, Any]:
     """Summarize news articles using LLM."""
-    from app.agents.summarizer_agent import SummarizerAgent
-    
+    articles = await payload_store.load_items(job_id, "articles", article_ids)
     agent = SummarizerAgent(job_id)
     result = await agent.run(articles)
     
+    result["summary_ids"] = await payload_store.store_items(job_id, "summaries", result.pop("summaries"))
     return result
 
 
 @activity.defn
-async def critique_summaries(job_id: str, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+@_with_retry_jitter
+@_memoize_result
+async def critique_summaries(job_id: str, summary_ids: List[str]) -> Dict[str, Any]:
     """Review and improve summaries using quality critique."""
-    from app.agents.critic_agent import CriticAgent
-    
+    summaries = await payload_store.load_items(job_id, "summaries", summary_ids)
     agent = CriticAgent(job_id)
     result = await agent.run(summaries)
     
+    result["improved_summary_ids"] = await payload_store.store_items(
+        job_id, "improved_summaries", result.pop("improved_summaries")
+    )
     return result
 
 
 @activity.defn
-async def analyze_news(job_id: str, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+@_with_retry_jitter
+@_memoize_result
+async def analyze_news(
+    job_id: str,
+    summary_ids: List[str],
+    include_overall_trends: bool = True
+) -> Dict[str, Any]:
     """Analyze news summaries for trends and insights."""
-    from app.agents.analyst_agent import AnalystAgent
+    summaries = await payload_store.load_items(job_id, "summaries", summary_ids)
+    agent = AnalystAgent(job_id)
+    result = await agent.run(summaries, include_overall_trends)
     
+    return result
+
+
+@activity.defn
+@_with_retry_jitter
+@_memoize_result
+async def analyze_overall_trends(job_id: str, improved_summary_ids: List[str]) -> Dict[str, Any]:
+    """Analyze overall trends across all news summaries."""
+    summaries = await payload_store.load_items(job_id, "improved_summaries", improved_summary_ids)
     agent = AnalystAgent(job_id)
-    result = await agent.run(summaries)
+    result = await agent.run_overall_trends(summaries)
     
     return result
 
 
+@activity.defn
+async def persist_final_result(job_id: str, result: Dict[str, Any]) -> str:
+    """Store the zstd-compressed workflow result on the job and return a pointer to it."""
+    blob = encode_result(result)
+    
+    with SessionLocal.begin() as db:
+        db.execute(
+            update(NewsJob)
+            .where(NewsJob.job_id == job_id)
+            .values(result_blob=blob)
+            .execution_options(synchronize_session=False)
+        )
+    
+    return f"db://news_jobs/{job_id}/result_blob"
+
+
 @activity.defn
 async def mark_job_completed(job_id: str) -> None:
     """Mark a job as completed in the database."""
-    from app.config.database import SessionLocal
-    from app.models.news import NewsJob
-    from datetime import datetime
-    
-    db = SessionLocal()
-    try:
-        job = db.query(NewsJob).filter(NewsJob.job_id == job_id).first()
-        if job:
-            job.status = "completed"
-            job.completed_at = datetime.utcnow()
-            db.commit()
-    finally:
-        db.close()
+    with SessionLocal.begin() as db:
+        db.execute(
+            update(NewsJob)
+            .where(NewsJob.job_id == job_id)
+            .values(
+                status="completed",
+                completed_at=datetime.utcnow()
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _classify_error(error_message: str) -> str:
+    """Return the error type of the first pattern, in priority order, found in the message."""
+    return next(
+        (error_type for error_type, pattern in ERROR_TYPE_PATTERNS if pattern.search(error_message)),
+        "unknown"
+    )
 
 
 @activity.defn
 async def mark_job_failed(job_id: str, error_message: str) -> None:
     """Mark a job as failed in the database."""
-    from app.config.database import SessionLocal
-    from app.models.news import NewsJob
-    from datetime import datetime
-    from prometheus_client import Counter
-    
-    # Prometheus error metrics
-    WORKFLOW_ERRORS = Counter('news_workflow_errors_total', 'Total workflow errors', ['error_type'])
-    
-    # Determine error type from message
-    error_type = "unknown"
-    if "temporal" in error_message.lower():
-        error_type = "temporal"
-    elif "ollama" in error_message.lower() or "llm" in error_message.lower():
-        error_type = "llm"
-    elif "database" in error_message.lower():
-        error_type = "database"
-    elif "scraping" in error_message.lower() or "rss" in error_message.lower():
-        error_type = "scraping"
-    
     # Update error metrics
-    WORKFLOW_ERRORS.labels(error_type=error_type).inc()
+    WORKFLOW_ERRORS.labels(error_type=_classify_error(error_message)).inc()
     
-    db = SessionLocal()
-    try:
-        job = db.query(NewsJob).filter(NewsJob.job_id == job_id).first()
-        if job:
-            job.status = "failed"
-            job.error_message = error_message
-            job.completed_at = datetime.utcnow()
-            db.commit()
-    finally:
-        db.close()
\ No newline at end of file
+    with SessionLocal.begin() as db:
+        db.execute(
+            update(NewsJob)
+            .where(NewsJob.job_id == job_id)
+            .values(
+                status="failed",
+                error_message=error_message,
+                completed_at=datetime.utcnow()
+            )
+            .execution_options(synchronize_session=False)
+        )
\ No newline at end of file
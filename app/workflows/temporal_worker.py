@@ -1,6 +1,5 @@
 import asyncio
-import os
-from datetime import timedelta, datetime
+from datetime import timedelta
 from dotenv import load_dotenv
 from temporalio.client import Client
 from temporalio.worker import Worker
@@ -11,12 +10,19 @@ load_dotenv()
 
 from app.config.settings import get_settings
 from app.config.logging import get_logger, setup_logging
+from app.services.groq_client import close_groq_client, get_groq_client
+from app.workflows.converter import orjson_data_converter
 from app.workflows.news_workflow import (
     NewsWorkflow, 
-    scrape_news,
+    TASK_QUEUE_IO,
+    NON_RETRYABLE_ERROR_TYPES,
+    scrape_news_batch,
+    save_scraped_articles,
     summarize_news,
     critique_summaries,  # Added missing import
     analyze_news,
+    analyze_overall_trends,
+    persist_final_result,
     mark_job_completed,
     mark_job_failed
 )
@@ -25,7 +31,7 @@ setup_logging()
 logger = get_logger(__name__)
 settings = get_settings()
 
-TASK_QUEUE = "news-processing"
+TASK_QUEUE = settings.temporal_task_queue
 
 
 class TemporalService:
@@ -40,7 +46,10 @@ class TemporalService:
         logger.info("Connecting to Temporal server", host=settings.temporal_host)
         
         try:
-            self.client = await Client.connect(settings.temporal_host)
+            self.client = await Client.connect(
+                settings.temporal_host,
+                data_converter=orjson_data_converter
+            )
             logger.info("Connected to Temporal server successfully")
         except Exception as e:
             logger.error("Failed to connect to Temporal server", error=str(e))
@@ -70,13 +79,21 @@ class TemporalService:
         
         handle = await self.client.start_workflow(
             NewsWorkflow.run,
-            args=[job_id, target_date],
+            args=[
+                job_id,
+                target_date,
+                settings.workflow_batch_size,
+                settings.workflow_scrape_groups,
+                settings.workflow_max_parallel_batches
+            ],
             id=f"news_workflow_{job_id}",
             task_queue=TASK_QUEUE,
             execution_timeout=timedelta(minutes=30),
             retry_policy=RetryPolicy(
                 initial_interval=timedelta(seconds=30),
-                maximum_attempts=2
+                backoff_coefficient=2.0,
+                maximum_attempts=2,
+                non_retryable_error_types=NON_RETRYABLE_ERROR_TYPES
             )
         )
         
@@ -94,7 +111,10 @@ async def run_worker():
     logger.info("Starting Temporal worker")
     
     # Connect to Temporal
-    client = await Client.connect(settings.temporal_host)
+    client = await Client.connect(
+        settings.temporal_host,
+        data_converter=orjson_data_converter
+    )
     
     # Create worker with workflows and activities
     worker = Worker(
@@ -104,20 +124,45 @@ async def run_worker():
             NewsWorkflow
         ],
         activities=[
-            scrape_news,
+            scrape_news_batch,
+            save_scraped_articles,
             summarize_news,
             critique_summaries,  # Added missing critique activity
             analyze_news,
+            analyze_overall_trends
+        ],
+        max_concurrent_activities=settings.worker_max_concurrent_activities,
+        max_concurrent_workflow_tasks=settings.worker_max_concurrent_workflow_tasks,
+        max_concurrent_activity_task_polls=settings.worker_max_concurrent_activity_task_polls,
+        max_concurrent_workflow_task_polls=settings.worker_max_concurrent_workflow_task_polls,
+        disable_eager_activity_execution=settings.worker_disable_eager_activity_execution
+    )
+    
+    # Lean worker for the DB-only job status activities
+    io_worker = Worker(
+        client,
+        task_queue=TASK_QUEUE_IO,
+        activities=[
+            persist_final_result,
             mark_job_completed,
             mark_job_failed
         ]
     )
     
-    logger.info("Temporal worker configured", task_queue=TASK_QUEUE)
+    logger.info("Temporal worker configured", task_queue=TASK_QUEUE, io_task_queue=TASK_QUEUE_IO)
     
-    # Run worker
+    # Open the Groq connection once so the first activity doesn't pay for the handshake
+    try:
+        await get_groq_client().list_models()
+    except ValueError as e:
+        logger.warning("Skipping Groq connection warm-up", error=str(e))
+    
+    # Run workers
     logger.info("Starting worker execution")
-    await worker.run()
+    try:
+        await asyncio.gather(worker.run(), io_worker.run())
+    finally:
+        await close_groq_client()
 
 
 async def main():
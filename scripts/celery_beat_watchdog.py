@@ -13,11 +13,14 @@ new schedule configurations from the database.
 import os
 import sys
 import time
+import random
 import signal
-import subprocess
+import asyncio
 import logging
 from pathlib import Path
 
+from watchfiles import Change, awatch
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,60 +36,77 @@ BEAT_COMMAND = [
 ]
 
 RESTART_MARKER = 'celerybeat-restart.marker'
-CHECK_INTERVAL = 5  # seconds
+KEEPALIVE_INTERVAL = 30  # seconds; upper bound between health checks when nothing happens
 MAX_RESTART_ATTEMPTS = 3
+BASE_RESTART_DELAY = 2  # seconds before the first restart after a crash
+MAX_RESTART_DELAY = 60  # ceiling for the exponential restart backoff
+STABILITY_WINDOW = 60  # seconds Beat must stay up before crash restarts are forgotten
+PUMP_READ_SIZE = 64 * 1024  # bytes of Beat output forwarded per read
 
 class CeleryBeatWatchdog:
     """Watchdog that manages Celery Beat lifecycle and handles restart requests."""
     
     def __init__(self):
         self.beat_process = None
+        self.stdout_task = None
         self.restart_attempts = 0
+        self.last_start_ts = 0.0
         self.should_exit = False
         
-        # Set up signal handlers
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        # Created in run() so they belong to the running event loop
+        self.stop_event = None
+        self.marker_event = None
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self, signum):
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, shutting down...")
         self.should_exit = True
-        self._stop_beat()
+        self.stop_event.set()
     
-    def _start_beat(self):
+    async def _start_beat(self):
         """Start Celery Beat process."""
         try:
             logger.info("Starting Celery Beat process...")
-            self.beat_process = subprocess.Popen(
-                BEAT_COMMAND,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+            self.beat_process = await asyncio.create_subprocess_exec(
+                *BEAT_COMMAND,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                # Own process group, so stopping Beat also stops anything it spawned
+                start_new_session=True
             )
             logger.info(f"Celery Beat started with PID: {self.beat_process.pid}")
-            self.restart_attempts = 0
+            
+            # Forward Beat output alongside the control loop
+            self.stdout_task = asyncio.create_task(self._pump_stdout(self.beat_process))
+            self.last_start_ts = time.monotonic()
             return True
         except Exception as e:
             logger.error(f"Failed to start Celery Beat: {e}")
             return False
     
-    def _stop_beat(self):
+    async def _stop_beat(self):
         """Stop Celery Beat process."""
         if self.beat_process:
             try:
                 logger.info("Stopping Celery Beat process...")
-                self.beat_process.terminate()
+                if self.beat_process.returncode is None:
+                    self._signal_beat_group(signal.SIGTERM)
                 
                 # Wait for graceful shutdown
                 try:
-                    self.beat_process.wait(timeout=10)
-                except subprocess.TimeoutExpired:
+                    await asyncio.wait_for(self.beat_process.wait(), timeout=10)
+                except asyncio.TimeoutError:
                     logger.warning("Celery Beat didn't stop gracefully, killing...")
-                    self.beat_process.kill()
-                    self.beat_process.wait()
+                    self._signal_beat_group(signal.SIGKILL)
+                    await self.beat_process.wait()
+                
+                # The pump finishes once the pipe reaches EOF
+                if self.stdout_task:
+                    try:
+                        await asyncio.wait_for(self.stdout_task, timeout=5)
+                    except asyncio.TimeoutError:
+                        pass
+                    self.stdout_task = None
                 
                 logger.info("Celery Beat stopped")
                 self.beat_process = None
@@ -94,16 +114,57 @@ class CeleryBeatWatchdog:
             except Exception as e:
                 logger.error(f"Error stopping Celery Beat: {e}")
     
+    def _signal_beat_group(self, signum):
+        """Send a signal to Beat's process group."""
+        # Beat leads its own session, so its PID is also the group ID
+        try:
+            os.killpg(self.beat_process.pid, signum)
+        except ProcessLookupError:
+            pass
+    
+    async def _pump_stdout(self, process):
+        """Forward Beat output as it arrives until the pipe closes."""
+        # Read whatever is buffered (up to PUMP_READ_SIZE) and write it back in
+        # one call, passing the raw bytes through instead of re-printing each line;
+        # keep print()'s buffering and only flush per read on a terminal
+        out = sys.stdout.buffer
+        interactive = out.isatty()
+        pending = b''
+        while True:
+            chunk = await process.stdout.read(PUMP_READ_SIZE)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b'\n')
+            if lines:
+                out.write(b''.join(b'[BEAT] ' + line + b'\n' for line in lines))
+                if interactive:
+                    out.flush()
+        if pending:
+            out.write(b'[BEAT] ' + pending + b'\n')
+        out.flush()
+    
+    async def _watch_restart_marker(self):
+        """Set marker_event whenever the restart marker is created."""
+        def is_marker(change, path):
+            return change != Change.deleted and os.path.basename(path) == RESTART_MARKER
+        
+        async for _ in awatch('.', watch_filter=is_marker, recursive=False, stop_event=self.stop_event):
+            self.marker_event.set()
+    
     def _check_restart_marker(self):
-        """Check if restart has been requested."""
-        if os.path.exists(RESTART_MARKER):
-            logger.info("Restart marker found, initiating restart...")
-            try:
-                os.remove(RESTART_MARKER)
-            except Exception as e:
-                logger.warning(f"Could not remove restart marker: {e}")
-            return True
-        return False
+        """Consume the restart marker, returning True if a restart was requested."""
+        # Producers rename a fully written marker into place, so a single unlink
+        # both checks for it and consumes it without a stat/remove race
+        try:
+            os.unlink(RESTART_MARKER)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Could not remove restart marker: {e}")
+            return False
+        
+        logger.info("Restart marker found, initiating restart...")
+        return True
     
     def _is_beat_healthy(self):
         """Check if Celery Beat process is still running."""
@@ -111,67 +172,107 @@ class CeleryBeatWatchdog:
             return False
         
         # Check if process is still alive
-        poll_result = self.beat_process.poll()
-        return poll_result is None
-    
-    def _restart_beat(self):
-        """Restart Celery Beat process."""
-        self.restart_attempts += 1
-        
-        if self.restart_attempts > MAX_RESTART_ATTEMPTS:
-            logger.error(f"Max restart attempts ({MAX_RESTART_ATTEMPTS}) reached, exiting...")
-            self.should_exit = True
+        if self.beat_process.returncode is not None:
             return False
         
-        logger.info(f"Restarting Celery Beat (attempt {self.restart_attempts}/{MAX_RESTART_ATTEMPTS})...")
+        # Beat has been up long enough that earlier crashes were not a crash loop
+        if self.restart_attempts and time.monotonic() - self.last_start_ts > STABILITY_WINDOW:
+            logger.info("Celery Beat is stable, resetting restart attempts")
+            self.restart_attempts = 0
+        return True
+    
+    async def _restart_beat(self, crashed=True):
+        """
+        Restart Celery Beat process.
         
-        self._stop_beat()
-        time.sleep(2)  # Brief pause
+        Crash restarts back off exponentially with jitter and count towards
+        MAX_RESTART_ATTEMPTS; requested restarts only wait the base delay.
+        """
+        if crashed:
+            self.restart_attempts += 1
+            
+            if self.restart_attempts > MAX_RESTART_ATTEMPTS:
+                logger.error(f"Max restart attempts ({MAX_RESTART_ATTEMPTS}) reached, exiting...")
+                self.should_exit = True
+                return False
+            
+            delay = min(MAX_RESTART_DELAY, BASE_RESTART_DELAY * 1.5 ** (self.restart_attempts - 1))
+            delay += random.uniform(0, 0.5)
+            logger.info(f"Restarting Celery Beat in {delay:.1f}s "
+                        f"(attempt {self.restart_attempts}/{MAX_RESTART_ATTEMPTS})...")
+        else:
+            delay = BASE_RESTART_DELAY
+            logger.info("Restarting Celery Beat to pick up schedule changes...")
         
-        return self._start_beat()
+        await self._stop_beat()
+        await asyncio.sleep(delay)
+        
+        return await self._start_beat()
     
-    def run(self):
+    async def run(self):
         """Main watchdog loop."""
         logger.info("Starting Celery Beat Watchdog...")
         
+        self.stop_event = asyncio.Event()
+        self.marker_event = asyncio.Event()
+        
+        # Set up signal handlers
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, self._signal_handler, signum)
+        
         # Start initial Beat process
-        if not self._start_beat():
+        if not await self._start_beat():
             logger.error("Failed to start initial Celery Beat process")
             return 1
         
-        # Main monitoring loop
-        while not self.should_exit:
-            try:
+        # Watch for the restart marker via filesystem events instead of polling
+        watcher_task = asyncio.create_task(self._watch_restart_marker())
+        stop_task = asyncio.create_task(self.stop_event.wait())
+        
+        # Main monitoring loop: wait for whichever of Beat exit, restart marker
+        # or shutdown signal happens first. Unexpected errors are not retried in
+        # place (a persistent fault would spin the loop); Beat is stopped and the
+        # watchdog exits non-zero instead.
+        exit_code = 0
+        try:
+            while not self.should_exit:
+                exit_task = asyncio.create_task(self.beat_process.wait())
+                marker_task = asyncio.create_task(self.marker_event.wait())
+                await asyncio.wait(
+                    {exit_task, marker_task, stop_task},
+                    timeout=KEEPALIVE_INTERVAL,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                exit_task.cancel()
+                marker_task.cancel()
+                self.marker_event.clear()
+                if self.should_exit:
+                    break
+                
                 # Check if restart was requested
                 if self._check_restart_marker():
-                    if not self._restart_beat():
+                    if not await self._restart_beat(crashed=False):
                         break
                 
                 # Check if process is still healthy
                 elif not self._is_beat_healthy():
                     logger.warning("Celery Beat process died unexpectedly")
-                    if not self._restart_beat():
+                    if not await self._restart_beat():
                         break
-                
-                # Log output from beat process
-                if self.beat_process and self.beat_process.stdout:
-                    try:
-                        line = self.beat_process.stdout.readline()
-                        if line:
-                            print(f"[BEAT] {line.strip()}")
-                    except Exception:
-                        pass  # Non-blocking read might fail
-                
-                time.sleep(CHECK_INTERVAL)
-                
-            except Exception as e:
-                logger.error(f"Error in watchdog loop: {e}")
-                time.sleep(CHECK_INTERVAL)
         
-        # Cleanup
-        self._stop_beat()
-        logger.info("Celery Beat Watchdog stopped")
-        return 0
+        except Exception:
+            logger.exception("Error in watchdog loop, shutting down")
+            exit_code = 1
+        
+        finally:
+            # Cleanup
+            watcher_task.cancel()
+            stop_task.cancel()
+            await self._stop_beat()
+            logger.info("Celery Beat Watchdog stopped")
+        
+        return exit_code
 
 
 def main():
@@ -181,8 +282,8 @@ def main():
     os.chdir(project_dir)
     
     watchdog = CeleryBeatWatchdog()
-    return watchdog.run()
+    return asyncio.run(watchdog.run())
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
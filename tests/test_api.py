@@ -1,14 +1,69 @@
+import uuid
+from datetime import datetime
 import pytest
-import asyncio
-from fastapi.testclient import TestClient
-from app.main import app
+import httpx
+from app.config.database import SessionLocal
+from app.main import app, trigger_manual_news_processing
+from app.models.news import NewsJob
+from app.services.redis_stream import redis_stream_service
 
-client = TestClient(app)
+pytestmark = pytest.mark.anyio
 
 
-def test_health_check():
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client(anyio_backend):
+    """Async client shared by all tests, calling the app in-process."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def no_celery(monkeypatch):
+    """Keep endpoints from enqueueing real Celery tasks."""
+    monkeypatch.setattr(trigger_manual_news_processing, "delay", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def no_stream_updates(monkeypatch):
+    """Keep status changes from being published to Redis."""
+    async def publish_updates(updates):
+        return None
+    monkeypatch.setattr(redis_stream_service, "publish_updates", publish_updates)
+
+
+@pytest.fixture
+def create_jobs():
+    """Create jobs with the given statuses and delete them after the test."""
+    job_ids = []
+    
+    def create(*statuses):
+        created = []
+        with SessionLocal() as db:
+            for status in statuses:
+                job_id = f"test-{uuid.uuid4()}"
+                completed_at = datetime(2025, 1, 1) if status == "completed" else None
+                db.add(NewsJob(job_id=job_id, status=status, completed_at=completed_at))
+                created.append(job_id)
+            db.commit()
+        job_ids.extend(created)
+        return created
+    
+    yield create
+    
+    with SessionLocal() as db:
+        db.query(NewsJob).filter(NewsJob.job_id.in_(job_ids)).delete(synchronize_session=False)
+        db.commit()
+
+
+async def test_health_check(client):
     """Test health check endpoint."""
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
@@ -16,9 +71,9 @@ def test_health_check():
     assert data["service"] == "ai-news-summarizer"
 
 
-def test_trigger_news_workflow():
+async def test_trigger_news_workflow(client, no_celery):
     """Test triggering news workflow."""
-    response = client.post("/news/run")
+    response = await client.post("/news/run")
     assert response.status_code == 200
     data = response.json()
     assert "job_id" in data
@@ -26,9 +81,62 @@ def test_trigger_news_workflow():
     assert "stream_url" in data
 
 
-def test_list_jobs():
+async def test_list_jobs(client):
     """Test listing jobs."""
-    response = client.get("/news/jobs")
+    response = await client.get("/news/jobs")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+
+
+async def test_terminate_workflows_empty(client, no_stream_updates):
+    """Test bulk termination with no job IDs."""
+    response = await client.post("/news/workflow/terminate", json={"job_ids": []})
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
\ No newline at end of file
+    assert data["success"] is True
+    assert data["terminated_job_ids"] == []
+
+
+async def test_terminate_workflows_unknown_jobs(client, no_stream_updates):
+    """Test bulk termination of job IDs that don't exist."""
+    job_ids = [f"missing-{uuid.uuid4()}", f"missing-{uuid.uuid4()}"]
+    response = await client.post("/news/workflow/terminate", json={"job_ids": job_ids})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is False
+    assert data["terminated_job_ids"] == []
+
+
+async def test_terminate_workflows_mixed_statuses(client, no_stream_updates, create_jobs):
+    """Test bulk termination of running and already finished jobs."""
+    running_id, completed_id = create_jobs("started", "completed")
+    missing_id = f"missing-{uuid.uuid4()}"
+    
+    response = await client.post(
+        "/news/workflow/terminate",
+        json={"job_ids": [running_id, completed_id, missing_id], "reason": "test cleanup"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is False
+    assert sorted(data["terminated_job_ids"]) == sorted([running_id, completed_id])
+    
+    with SessionLocal() as db:
+        jobs = {job.job_id: job for job in db.query(NewsJob).filter(NewsJob.job_id.in_([running_id, completed_id]))}
+    assert all(job.status == "terminated" and job.error_message == "test cleanup" for job in jobs.values())
+    # A finished job keeps its original completion time
+    assert jobs[completed_id].completed_at == datetime(2025, 1, 1)
+    assert jobs[running_id].completed_at is not None
+
+
+async def test_terminate_workflow_single(client, no_stream_updates, create_jobs):
+    """Test terminating one job goes through the bulk path."""
+    (job_id,) = create_jobs("started")
+    response = await client.post(f"/news/workflow/terminate/{job_id}")
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    
+    response = await client.post(f"/news/workflow/terminate/missing-{uuid.uuid4()}")
+    assert response.status_code == 200
+    assert response.json()["success"] is False
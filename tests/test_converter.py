@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime, timezone
+
+from app.workflows.converter import orjson_data_converter
+
+
+def test_orjson_converter_round_trip():
+    """Test UUIDs, datetimes and nested dicts survive a payload round trip."""
+    job_uuid = uuid.uuid4()
+    value = {
+        "job_id": job_uuid,
+        "created_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "scraped_at": datetime(2025, 1, 2, 3, 4, 5),
+        "article": {"title": "Headline", "tags": ["ai", "news"], "meta": {"score": 0.5, "source": None}},
+    }
+    payload_converter = orjson_data_converter.payload_converter
+
+    payloads = payload_converter.to_payloads([value])
+    assert payloads[0].metadata["encoding"] == b"json/plain"
+
+    [decoded] = payload_converter.from_payloads(payloads)
+    assert decoded == {
+        "job_id": str(job_uuid),
+        "created_at": "2025-01-02T03:04:05Z",
+        "scraped_at": "2025-01-02T03:04:05",
+        "article": {"title": "Headline", "tags": ["ai", "news"], "meta": {"score": 0.5, "source": None}},
+    }
+
+
+def test_orjson_converter_handles_non_json_values():
+    """Test plain values and None still use the default converters."""
+    payload_converter = orjson_data_converter.payload_converter
+    values = [None, "job-1", 3, ["a", "b"]]
+    assert payload_converter.from_payloads(payload_converter.to_payloads(values)) == values
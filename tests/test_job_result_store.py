@@ -0,0 +1,15 @@
+from app.services.job_result_store import decode_result, encode_result
+
+
+def test_result_blob_round_trip():
+    """Test a stored workflow result decodes back to the original."""
+    result = {
+        "job_id": "job-1",
+        "status": "completed",
+        "articles_count": 3,
+        "summary_ids": ["a", "b", "c"],
+        "analyses": [{"analysis_type": "trend", "insights": ["x"]}],
+    }
+    blob = encode_result(result)
+    assert isinstance(blob, bytes)
+    assert decode_result(blob) == result
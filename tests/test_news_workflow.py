@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+from app.workflows import news_workflow as news_workflow_module
+from app.workflows.news_workflow import (
+    RETRY_JITTER_MAX_SECONDS,
+    _chunks,
+    _classify_error,
+    _with_retry_jitter,
+)
+
+
+@pytest.mark.parametrize("message, error_type", [
+    ("Temporal activity timed out", "temporal"),
+    ("Groq API error: 429", "llm"),
+    ("database connection refused", "database"),
+    ("RSS feed unreachable", "scraping"),
+    ("something else broke", "unknown"),
+    # Several keywords: the higher-priority type wins regardless of position
+    ("RSS feed failed after Temporal activity timeout", "temporal"),
+    ("database error from LLM call", "llm"),
+    ("scraping failed: database locked", "database"),
+])
+def test_classify_error(message, error_type):
+    """Test error classification follows the keyword priority order."""
+    assert _classify_error(message) == error_type
+
+
+@pytest.mark.parametrize("count, size, expected_sizes", [
+    (0, 3, []),
+    (1, 3, [1]),
+    (3, 3, [3]),
+    (4, 3, [3, 1]),
+    (6, 3, [3, 3]),
+    (2, 0, [1, 1]),
+])
+def test_chunks_boundaries(count, size, expected_sizes):
+    """Test items split into consecutive batches without losing or reordering any."""
+    items = list(range(count))
+    batches = _chunks(items, size)
+    assert [len(batch) for batch in batches] == expected_sizes
+    assert [item for batch in batches for item in batch] == items
+
+
+@pytest.fixture
+def jitter_delays(monkeypatch):
+    """Record jitter sleeps, always drawing the largest allowed delay."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(news_workflow_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(news_workflow_module.random, "uniform", lambda low, high: high)
+    return delays
+
+
+async def _activity_result():
+    return "done"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("attempt, expected_delays", [
+    (1, []),
+    (2, [1.0]),
+    (4, [4.0]),
+    (20, [RETRY_JITTER_MAX_SECONDS]),
+])
+async def test_retry_jitter_delay_is_capped(monkeypatch, jitter_delays, attempt, expected_delays):
+    """Test the first attempt runs at once and retry delays never exceed the cap."""
+    monkeypatch.setattr(news_workflow_module.activity, "info", lambda: SimpleNamespace(attempt=attempt))
+
+    assert await _with_retry_jitter(_activity_result)() == "done"
+    assert jitter_delays == expected_delays
@@ -0,0 +1,79 @@
+import pytest
+from app.services.payload_store import PayloadStore
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def hset(self, key, mapping):
+        self.commands.append(lambda: self.client.hashes.setdefault(key, {}).update(mapping))
+
+    def expire(self, key, seconds):
+        self.commands.append(lambda: self.client.expiries.__setitem__(key, seconds))
+
+    async def execute(self):
+        for command in self.commands:
+            command()
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands the store uses."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.expiries = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hmget(self, key, fields):
+        stored = self.hashes.get(key, {})
+        return [stored.get(field) for field in fields]
+
+
+@pytest.fixture
+def store():
+    payload_store = PayloadStore()
+    payload_store.redis_client = FakeRedis()
+    return payload_store
+
+
+@pytest.mark.anyio
+async def test_store_and_load_items(store):
+    """Test items come back in the requested order under the job's hash."""
+    items = [
+        {"id": 1, "title": "First", "tags": ["ai"]},
+        {"id": 2, "title": "Second", "meta": {"score": 0.9}},
+    ]
+
+    item_ids = await store.store_items("job-1", "articles", items)
+
+    assert item_ids == ["1", "2"]
+    assert set(store.redis_client.hashes["job-1:articles"]) == {"1", "2"}
+    assert "job-1:articles" in store.redis_client.expiries
+    assert await store.load_items("job-1", "articles", ["2", "1"]) == [items[1], items[0]]
+
+
+@pytest.mark.anyio
+async def test_empty_items_skip_redis(store):
+    """Test empty stores and loads don't touch Redis."""
+    assert await store.store_items("job-1", "articles", []) == []
+    assert await store.load_items("job-1", "articles", []) == []
+    assert store.redis_client.hashes == {}
+
+
+@pytest.mark.anyio
+async def test_load_missing_item_raises_key_error(store):
+    """Test a missing item fails loudly instead of being dropped."""
+    await store.store_items("job-1", "summaries", [{"id": "a", "summary": "text"}])
+
+    with pytest.raises(KeyError, match="1 summaries not found in job-1:summaries"):
+        await store.load_items("job-1", "summaries", ["a", "b"])
@@ -0,0 +1,61 @@
+import pytest
+from app.services import workflow_status_sync as status_sync_module
+from app.services.workflow_status_sync import WorkflowStatusSync
+
+
+def _update(job_id, status, **data):
+    return {"job_id": job_id, "status": status, "message": f"msg {status}", "data": data}
+
+
+def test_merge_updates_newer_status_wins():
+    """Test a later non-terminal status replaces an earlier one."""
+    merged = WorkflowStatusSync()._merge_updates(
+        _update("job-1", "scraping", step=1),
+        _update("job-1", "summarizing", step=2)
+    )
+    assert merged["status"] == "summarizing"
+    assert merged["message"] == "msg summarizing"
+    assert merged["data"] == {"step": 2}
+
+
+def test_merge_updates_terminal_status_is_kept():
+    """Test a late non-terminal update can't overwrite a terminal status."""
+    merged = WorkflowStatusSync()._merge_updates(
+        _update("job-1", "completed", articles=5),
+        _update("job-1", "analyzing", step=3)
+    )
+    assert merged["status"] == "completed"
+    assert merged["message"] == "msg completed"
+    assert merged["data"] == {"articles": 5, "step": 3}
+
+
+def test_merge_updates_newest_terminal_status_wins():
+    """Test the newer of two terminal statuses wins."""
+    merged = WorkflowStatusSync()._merge_updates(
+        _update("job-1", "completed"),
+        _update("job-1", "terminated")
+    )
+    assert merged["status"] == "terminated"
+
+
+@pytest.mark.anyio
+async def test_close_flushes_pending_updates(monkeypatch):
+    """Test updates still inside the batch window are published on close."""
+    published = []
+
+    async def publish_updates(updates):
+        published.extend(updates)
+
+    monkeypatch.setattr(status_sync_module.redis_stream_service, "publish_updates", publish_updates)
+
+    sync = WorkflowStatusSync()
+    sync._enqueue_publish(_update("job-1", "scraping"))
+    sync._enqueue_publish(_update("job-1", "completed"))
+    sync._enqueue_publish(_update("job-2", "started"))
+    await sync.close()
+
+    assert sorted((update["job_id"], update["status"]) for update in published) == [
+        ("job-1", "completed"),
+        ("job-2", "started"),
+    ]
+    assert sync._publish_task is None